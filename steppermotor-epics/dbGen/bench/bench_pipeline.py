@@ -0,0 +1,190 @@
+#!/usr/bin/python3
+
+"""@package docstring
+Benchmark of the dbGenerator pipeline on a synthetic ChimeraTK variable file. The stages are timed separately:
+Loading the XmlSource, generating the config file, processing the config file, compiling the databases of all output
+files and writing the db files. Results are written as JSON, to be compared with the results of another commit by
+passing them to --compare. Only the standard library is used, peak RSS is read via the resource module (Linux).
+"""
+
+import argparse  # Parse command line arguments
+import contextlib
+import cProfile
+import io
+import json
+import os  # For file manipulation
+import platform
+import resource
+import subprocess
+import sys  # To access stdout
+import tempfile
+import time
+import xml.etree.ElementTree as xmlEleTree
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from dbGenerator import VERSION, DbFile, EpicsCfg, LogBuffer  # noqa: E402
+from synthetic import write_variable_file, number_of_variables  # noqa: E402
+
+STAGES = ['load_source', 'generate_config_file', 'process_cfg_file', 'expand', 'write_db_file']
+
+
+def peak_rss_kib() -> int:
+    """Peak resident set size of this process so far.
+    :return: Peak RSS in KiB
+    """
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def git_revision() -> Optional[str]:
+    """Revision of the checked out tree, if it is a git repository.
+    :return: Commit hash, with "-dirty" appended for uncommitted changes, or None
+    """
+    repo_dir = os.path.dirname(os.path.abspath(__file__))
+    try:
+        revision = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=repo_dir, capture_output=True, text=True,
+                                  check=True).stdout.strip()
+        status = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=repo_dir,
+                                capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return revision + '-dirty' if status else revision
+
+
+def compile_databases(cfg: EpicsCfg) -> List[DbFile]:
+    """Compiles the databases of all output files in the config file with EpicsCfg.compile_database(), which is the
+    code process_cfg_file() runs for each output file, before writing it.
+    :param cfg: Config object, whose sources and scan classes have been loaded by process_cfg_file
+    :return: Compiled databases
+    """
+    cfg_root = xmlEleTree.parse(cfg.file_path).getroot()
+    ns = {'ns': cfg_root.tag.split(sep='{')[1].split(sep='}')[0]}
+    return [cfg.compile_database(output_file, ns)[0] for output_file in cfg_root.findall('ns:outputfile', ns)]
+
+
+def run_stage(name: str, function: Callable[[], Any], profile_dir: Optional[str], repetition: int) -> Dict[str, Any]:
+    """Runs and times a single stage, with its log output suppressed.
+    :param name: Name of the stage
+    :param function: Stage to run
+    :param profile_dir: Directory to dump cProfile stats into, or None to not profile
+    :param repetition: Number of the repetition, part of the name of the stats file
+    :return: Return value of function, wall time in s and peak RSS in KiB after the stage
+    """
+    profiler = cProfile.Profile() if profile_dir is not None else None
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        start = time.perf_counter()
+        if profiler is not None:
+            result = profiler.runcall(function)
+        else:
+            result = function()
+        duration = time.perf_counter() - start
+    if profiler is not None:
+        profiler.dump_stats(os.path.join(profile_dir, f'{name}.{repetition}.prof'))
+    return {'result': result, 'seconds': duration, 'peak_rss_kib': peak_rss_kib()}
+
+
+def run_pipeline(work_dir: str, xml_path: str, jobs: int, profile_dir: Optional[str],
+                 repetition: int) -> Dict[str, Dict[str, Any]]:
+    """Runs all stages once on a fresh config file.
+    :param work_dir: Directory for the config, db and log files
+    :param xml_path: Path to the variable file
+    :param jobs: Number of processes for process_cfg_file
+    :param profile_dir: Directory to dump cProfile stats into, or None to not profile
+    :param repetition: Number of the repetition
+    :return: Measurements by stage name
+    """
+    cfg_path = os.path.join(work_dir, f'bench-{repetition}-dbGen.xml')
+    logger = LogBuffer()
+    measurements = {}
+
+    def measure(name: str, function: Callable[[], Any]) -> Any:
+        measurement = run_stage(name, function, profile_dir, repetition)
+        measurements[name] = {'seconds': measurement['seconds'], 'peak_rss_kib': measurement['peak_rss_kib']}
+        return measurement['result']
+
+    EpicsCfg._compiled_templates.clear()
+    cfg = EpicsCfg(cfg_path, logger=logger)
+    measure('load_source', lambda: cfg.load_source(xml_path, 'xmlLabel'))
+    measure('generate_config_file', lambda: cfg.generate_config_file('xmlLabel'))
+    EpicsCfg._compiled_templates.clear()
+    cfg = EpicsCfg(cfg_path, logger=logger)
+    measure('process_cfg_file', lambda: cfg.process_cfg_file(use_cache=False, jobs=jobs))
+    EpicsCfg._compiled_templates.clear()
+    databases = measure('expand', lambda: compile_databases(cfg))
+    measure('write_db_file', lambda: [database.write_db_file(cfg_path) for database in databases])
+    return measurements
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any]):
+    """Prints the timing of each stage relative to a baseline.
+    :param results: Results of this run
+    :param baseline: Results of an earlier run, i.e. of another commit
+    """
+    if baseline['parameters'] != results['parameters']:
+        sys.stderr.write('Warning: Baseline was measured with different parameters!\n')
+    sys.stdout.write(f'\nCompared to {baseline.get("revision")}:\n')
+    for stage in STAGES:
+        try:
+            before = baseline['stages'][stage]['seconds']
+        except KeyError:
+            continue
+        after = results['stages'][stage]['seconds']
+        sys.stdout.write(f'{stage:22s}{before:10.4f} s -> {after:10.4f} s  ({after / before:6.2f}x)\n')
+
+
+def main():
+    clap = argparse.ArgumentParser(description='Benchmark the stages of the dbGenerator pipeline.')
+    clap.add_argument('-m', type=int, default=100, help='Number of motors. Defaults to 100.')
+    clap.add_argument('-d', type=int, default=2, help='Directory depth below each motor. Defaults to 2.')
+    clap.add_argument('-v', type=int, default=10, help='Variables per leaf directory. Defaults to 10.')
+    clap.add_argument('-r', type=int, default=3, help='Repetitions, the fastest is reported. Defaults to 3.')
+    clap.add_argument('-j', type=int, default=1, help='Processes used by process_cfg_file. Defaults to 1.')
+    clap.add_argument('-o', metavar='results', help='Write results as JSON to this file.')
+    clap.add_argument('--profile', metavar='directory', help='Dump cProfile stats of every stage into directory.')
+    clap.add_argument('--compare', metavar='baseline', help='JSON results of an earlier run to compare with.')
+    cla = clap.parse_args()
+
+    if cla.profile is not None:
+        os.makedirs(cla.profile, exist_ok=True)
+        profile_dir = os.path.abspath(cla.profile)
+    else:
+        profile_dir = None
+    runs = []
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as work_dir:
+        os.chdir(work_dir)  # Log files of generate_config_file are written to CWD
+        try:
+            xml_path = os.path.join(work_dir, 'benchserver.xml')
+            write_variable_file(xml_path, cla.m, depth=cla.d, variables_per_directory=cla.v)
+            for repetition in range(cla.r):
+                runs.append(run_pipeline(work_dir, xml_path, cla.j, profile_dir, repetition))
+        finally:
+            os.chdir(cwd)
+
+    results = {'revision': git_revision(),
+               'dbGenerator_version': VERSION,
+               'python': platform.python_version(),
+               'platform': platform.platform(),
+               'parameters': {'motors': cla.m, 'depth': cla.d, 'variables_per_directory': cla.v,
+                              'variables': number_of_variables(cla.m, cla.d, cla.v), 'jobs': cla.j},
+               'stages': {},
+               'peak_rss_kib': peak_rss_kib()}
+    sys.stdout.write(f'{results["parameters"]["variables"]} variables, best of {cla.r}:\n')
+    for stage in STAGES:
+        times = [run[stage]['seconds'] for run in runs]
+        results['stages'][stage] = {'seconds': min(times),
+                                    'runs': times,
+                                    'peak_rss_kib': runs[0][stage]['peak_rss_kib']}
+        sys.stdout.write(f'{stage:22s}{min(times):10.4f} s  '
+                         f'peak RSS {runs[0][stage]["peak_rss_kib"] / 1024:8.1f} MiB\n')
+    if cla.o is not None:
+        with open(cla.o, 'w', encoding='utf-8') as results_file:
+            json.dump(results, results_file, indent=2)
+            results_file.write('\n')
+    if cla.compare is not None:
+        with open(cla.compare, encoding='utf-8') as baseline_file:
+            compare(results, json.load(baseline_file))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/python3
+
+"""@package docstring
+Benchmark comparing hash-indexed and linear lookups in the Table class of dbGenerator.
+A synthetic ChimeraTK variable file is generated, loaded into an XmlSource and every
+address is looked up once through the index. The linear path is timed on a sample of
+addresses and extrapolated, as a full linear run over 50k variables takes hours.
+"""
+
+import argparse  # Parse command line arguments
+import os  # For file manipulation
+import random
+import sys  # To access stdout
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from dbGenerator import XmlSource  # noqa: E402
+from synthetic import write_variable_file, number_of_variables  # noqa: E402
+
+
+def main():
+    clap = argparse.ArgumentParser(description='Benchmark indexed vs. linear lookups in dbGenerator tables.')
+    clap.add_argument('-m', type=int, default=1250, help='Number of motors, 40 variables each. Defaults to 1250.')
+    clap.add_argument('-s', type=int, default=200, help='Number of linear lookups to sample. Defaults to 200.')
+    cla = clap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        xml_path = os.path.join(tmp_dir, 'benchserver.xml')
+        write_variable_file(xml_path, cla.m, depth=2, variables_per_directory=10)
+        start = time.perf_counter()
+        source = XmlSource(xml_path)
+        sys.stdout.write(f'Loading {number_of_variables(cla.m, 2, 10)} variables: '
+                         f'{time.perf_counter() - start:.3f} s\n')
+
+    addresses = source.column('address')
+    start = time.perf_counter()
+    for address in addresses:
+        source[address]
+    indexed_time = time.perf_counter() - start
+    sys.stdout.write(f'Indexed lookups of all {len(addresses)} addresses: {indexed_time:.3f} s\n')
+
+    sample = random.Random(0).sample(addresses, min(cla.s, len(addresses)))
+    start = time.perf_counter()
+    for address in sample:
+        source.query({'address': address}, use_index=False)
+    linear_time = (time.perf_counter() - start) * len(addresses) / len(sample)
+    sys.stdout.write(f'Linear lookups of all {len(addresses)} addresses (extrapolated from {len(sample)}): '
+                     f'{linear_time:.3f} s\n')
+    sys.stdout.write(f'Speedup: {linear_time / indexed_time:.0f}x\n')
+
+
+if __name__ == '__main__':
+    main()
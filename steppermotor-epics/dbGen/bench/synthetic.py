@@ -0,0 +1,69 @@
+"""@package docstring
+Generator for synthetic ChimeraTK variable files, as written by <ChimeraTK-server>-xmlGenerator, used by the
+benchmarks in this directory. Every motor gets a binary tree of directories with the given depth, whose leaf
+directories hold the variables. Value types and directions cycle, so all record types of the config file
+generation are covered.
+"""
+
+# Value type, direction and number of elements, assigned to the variables in turn
+VARIABLE_KINDS = [('double', 'control_system_to_application', 1),
+                  ('double', 'application_to_control_system', 1),
+                  ('int32', 'control_system_to_application', 1),
+                  ('int32', 'application_to_control_system', 1),
+                  ('uint64', 'application_to_control_system', 1),
+                  ('Boolean', 'control_system_to_application_with_return', 1),
+                  ('Boolean', 'application_to_control_system', 1),
+                  ('string', 'application_to_control_system', 1),
+                  ('float', 'application_to_control_system', 16),
+                  ('Void', 'application_to_control_system', 1)]
+
+# Directory names, used in turn on each level of the directory tree
+DIRECTORY_NAMES = ['controlInput', 'readback', 'position', 'status', 'swLimits', 'endSwitch']
+
+
+def number_of_variables(number_of_motors: int, depth: int, variables_per_directory: int) -> int:
+    """Number of variables in a file written by write_variable_file() with the same parameters.
+    :param number_of_motors: Number of motor directories
+    :param depth: Depth of the directory tree of each motor
+    :param variables_per_directory: Number of variables in each leaf directory
+    :return: Total number of variables
+    """
+    return number_of_motors * 2 ** depth * variables_per_directory
+
+
+def write_variable_file(file_path: str, number_of_motors: int, depth: int = 2, variables_per_directory: int = 10):
+    """Writes a synthetic ChimeraTK variable file.
+    :param file_path: Path to write the file to
+    :param number_of_motors: Number of motor directories
+    :param depth: Depth of the directory tree of each motor. With 0, variables are placed in the motor directory.
+    :param variables_per_directory: Number of variables in each leaf directory
+    """
+    var_number = 0
+
+    def write_directory(xml_file, name: str, level: int):
+        nonlocal var_number
+        indent = '  ' * level
+        xml_file.write(f'{indent}<directory name="{name}">\n')
+        if level < depth + 1:
+            for child in range(2):
+                child_name = DIRECTORY_NAMES[(2 * level + child) % len(DIRECTORY_NAMES)]
+                write_directory(xml_file, f'{child_name}{child}', level + 1)
+        else:
+            for _ in range(variables_per_directory):
+                value_type, direction, elements = VARIABLE_KINDS[var_number % len(VARIABLE_KINDS)]
+                xml_file.write(f'{indent}  <variable name="var{var_number}">\n'
+                               f'{indent}    <value_type>{value_type}</value_type>\n'
+                               f'{indent}    <direction>{direction}</direction>\n'
+                               f'{indent}    <unit>mm</unit>\n'
+                               f'{indent}    <description>{name} - Variable {var_number}</description>\n'
+                               f'{indent}    <numberOfElements>{elements}</numberOfElements>\n'
+                               f'{indent}  </variable>\n')
+                var_number += 1
+        xml_file.write(f'{indent}</directory>\n')
+
+    with open(file_path, 'w', encoding='utf-8') as xml_file:
+        xml_file.write('<?xml version="1.0" encoding="UTF-8"?>\n'
+                       '<application xmlns="https://github.com/ChimeraTK/ApplicationCore" name="benchserver">\n')
+        for motor in range(1, number_of_motors + 1):
+            write_directory(xml_file, f'Motor{motor}', 1)
+        xml_file.write('</application>\n')
@@ -7,15 +7,22 @@ Written and tested for Python 3.8 by Patrick Nonn for DESY/MSK
 """
 
 import argparse  # Parse command line arguments
+import bisect  # To keep row numbers in hash indexes sorted
+import hashlib  # To hash inputs of output files
+import json  # To store the generation cache
+import multiprocessing  # To select the start method of worker processes
 import os  # For file manipulation
 import re
 import sys  # To access stdout and stdin
 import xml.etree.ElementTree as xmlEleTree  # xml parser
-from typing import List, Dict, Any, Union, Optional  # Type hints
+from collections import Counter  # To count leafs per branch
+from collections.abc import Mapping, MutableMapping, Sequence  # Base classes for row views and column storage
+from concurrent.futures import ProcessPoolExecutor  # To process output files in parallel
+from typing import List, Dict, Any, Union, Optional, Tuple, Iterable, Iterator  # Type hints
 from datetime import datetime  # To access system time
 
 
-VERSION = '1.2'
+VERSION = '1.3'
 
 '''
 Changelog:
@@ -29,6 +36,22 @@ Changelog:
     14.Oct.2024: Limited aliasing for generated config files to one level
     17.Oct.2024: Added list of unused source file entries to log
     04.Nov.2024: Added ability to process <mask> and <record> entries under <ignore>
+1.3:
+    17.Oct.2026: Added hash indexes to Table for constant time look-ups in XmlSource and DbFile
+    17.Oct.2026: Table stores its content by column and provides rows as views, which keep the hash indexes current
+    17.Oct.2026: XmlSource streams the variable file with iterparse instead of loading the whole tree
+    17.Oct.2026: Macro expansion uses cached, precompiled templates instead of recursion
+    17.Oct.2026: Added cache file to skip output files with unchanged inputs, -f forces generation
+    17.Oct.2026: Added option -j to process output files in parallel
+    17.Oct.2026: Output files are streamed into a temporary file, which replaces the target file when complete
+    17.Oct.2026: Generated config files are indented in place and written directly to file
+    17.Oct.2026: Record types and shared fields are classified in a single pass in generate_config_file
+    17.Oct.2026: Added <scanclass> elements, referenced by the "scan" attribute of outputfile, recordgroup and record
+    17.Oct.2026: Added option -i to generate config files with SCAN=I/O Intr for input records
+    17.Oct.2026: Added scan load report per output file and in total, options -s and -e to scale it
+    17.Oct.2026: Added <combinedfile> elements, to write all instances of a db file into one mako-looped db file
+    17.Oct.2026: Unused source entries are kept in insertion ordered dicts, ignore masks are combined per source
+    17.Oct.2026: The config file in the header of db and description files is given relative to the file
 '''
 
 
@@ -98,6 +121,54 @@ def abbreviate(in_word: str) -> str:
     return output
 
 
+def write_file_atomically(file_path: str, content: Iterable[str], encoding: Optional[str] = None):
+    """
+    Function to write a file through a temporary file in the same directory, which is renamed to the target path when
+    complete. Readers of the target file either see the previous or the new content, but never a partial one.
+    :param file_path: Path of the file to be written
+    :param content: Iterable of strings, written one after another through a buffered file object
+    :param encoding: Encoding of the file. Defaults to the locale encoding, like open().
+    """
+    file_dir, file_name = os.path.split(os.path.abspath(file_path))
+    tmp_path = os.path.join(file_dir, f'.{file_name}.tmp')
+    try:
+        with open(tmp_path, 'w', encoding=encoding) as tmp_file:
+            tmp_file.writelines(content)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.isfile(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def indent_xml(element: xmlEleTree.Element, space: str = '  ', level: int = 0):
+    """
+    Function to indent an element tree in place for pretty printing, like xml.etree.ElementTree.indent(), which is
+    only available from Python 3.9 on. Whitespace-only text and tails are replaced, other content is kept.
+    :param element: Root element of the tree
+    :param space: Whitespace to insert for each indentation level
+    :param level: Indentation level of element
+    """
+    if not len(element):
+        return
+    child_indentation = '\n' + (level + 1) * space
+    if not element.text or not element.text.strip():
+        element.text = child_indentation
+    for child in element:
+        indent_xml(child, space, level + 1)
+        if not child.tail or not child.tail.strip():
+            child.tail = child_indentation
+    if not child.tail.strip():  # Dedent after the last child
+        child.tail = '\n' + level * space
+
+
+def _relative_source(source: Optional[str], file_path: str) -> Optional[str]:
+    """Path of the config file, a file was generated from, relative to the directory of that file."""
+    if source is None:
+        return None
+    return os.path.relpath(os.path.abspath(source), os.path.dirname(os.path.abspath(file_path)))
+
+
 # Class for text formatting
 class AsciiFormat:
     """Class to provide formatted strings for stdout."""
@@ -162,6 +233,27 @@ class SourceLoadError(Exception):
 
 # End of Exception definitions
 
+# EPICS macro "$(...)", removed to determine the length of PV names
+EPICS_MACRO_PATTERN = re.compile(r'\$\([^)]*\)')
+
+# Segment types of compiled "+{...}"-templates, see EpicsCfg._compile()
+SEGMENT_LITERAL = 0
+SEGMENT_ALIAS = 1
+SEGMENT_LINK = 2
+
+# Size in bytes of a single element, by FTVL or, for scalar records, by record type. Used to estimate the scan load.
+EPICS_ELEMENT_SIZES = {'DOUBLE': 8, 'FLOAT': 4, 'INT64': 8, 'UINT64': 8, 'LONG': 4, 'ULONG': 4, 'SHORT': 2,
+                       'USHORT': 2, 'CHAR': 1, 'UCHAR': 1, 'STRING': 40, 'ENUM': 2,
+                       'ai': 8, 'ao': 8, 'int64in': 8, 'int64out': 8, 'longin': 4, 'longout': 4, 'bi': 2, 'bo': 2,
+                       'mbbi': 2, 'mbbo': 2, 'mbbiDirect': 4, 'mbboDirect': 4, 'stringin': 40, 'stringout': 40,
+                       'lsi': 41, 'lso': 41, 'calc': 8, 'calcout': 8}
+# Bytes sent per monitor update of a PV to a Channel Access client: message header and DBR_TIME status and time stamp
+CA_UPDATE_OVERHEAD = 16 + 12
+# Periodic SCAN values, i.e. "1 second", ".5 seconds" or "10 Hz"
+EPICS_PERIODIC_SCAN_PATTERN = re.compile(r'^\s*([0-9.]+)\s*(second|seconds|Hz)\s*$')
+# Records loaded by dbLoadRecords() in an IOC startup script, i.e. dbLoadRecords("db/motor.db","Motor=M1")
+EPICS_DBLOADRECORDS_PATTERN = re.compile(r'^\s*dbLoadRecords\s*\(\s*"([^"]+)"', re.MULTILINE)
+
 
 class Logging:
     """
@@ -242,15 +334,112 @@ class Logging:
                 f.write(f'{datetime.now()}: {self._markdown(log_message)}\n')
 
 
+class LogBuffer:
+    """
+    Class to collect log messages, i.e. in worker processes, to be written to the actual log later on
+    """
+
+    def __init__(self):
+        self.messages = []  # type: List[str]
+
+    def write(self, log_message: str):
+        """
+        Stores message.
+        :param log_message: Message to be written, formatted for stderr/stdout
+        """
+        self.messages.append(log_message)
+
+
+class TableRow(MutableMapping):
+    """View on a single row of a ColumnStore. Reads and writes are passed through to the column lists."""
+    __slots__ = ('_columns', '_row_number', '_on_change')
+
+    def __init__(self, columns: Dict[str, List[Any]], row_number: int, on_change):
+        """
+        :param columns: Column lists of the ColumnStore, the row belongs to
+        :param row_number: Position of the row in the column lists
+        :param on_change: Callable on_change(row_number, col, old_value, new_value), called when a field is written,
+        i.e. to keep the hash indexes of the table up to date
+        """
+        self._columns = columns
+        self._row_number = row_number
+        self._on_change = on_change
+
+    def __getitem__(self, col: str) -> Any:
+        return self._columns[col][self._row_number]
+
+    def __setitem__(self, col: str, value: Any):
+        if col not in self._columns:
+            raise KeyError(f'Table has no column named "{col}"')
+        old_value = self._columns[col][self._row_number]
+        self._columns[col][self._row_number] = value
+        self._on_change(self._row_number, col, old_value, value)
+
+    def __delitem__(self, col: str):
+        raise TypeError('Fields can not be removed from a single row of a table! Use Table.remove_column() instead.')
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class ColumnStore(Sequence):
+    """Storage backend for class Table. Holds one list per column, with interned strings,
+    and provides the rows as TableRow views, created on demand."""
+
+    def __init__(self, column_names: List[str], on_change):
+        """
+        :param column_names: Names of the columns to be stored
+        :param on_change: Callable on_change(row_number, col, old_value, new_value), passed to the row views
+        """
+        self.columns = {col: [] for col in column_names}  # type: Dict[str, List[Any]]
+        self._length = 0
+        self._on_change = on_change
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, row_number: Union[int, slice]) -> Union[TableRow, List[TableRow]]:
+        if isinstance(row_number, slice):
+            return [TableRow(self.columns, n, self._on_change) for n in range(*row_number.indices(self._length))]
+        if row_number < 0:
+            row_number += self._length
+        if not 0 <= row_number < self._length:
+            raise IndexError('ColumnStore index out of range')
+        return TableRow(self.columns, row_number, self._on_change)
+
+    def append(self, row: Mapping):
+        """Splits row into the column lists.
+        :param row: Row to be added. Has to provide all columns.
+        """
+        for col, column in self.columns.items():
+            value = row[col]
+            column.append(sys.intern(value) if type(value) is str else value)
+        self._length += 1
+
+    def remove_column(self, col_name: str):
+        """Drops a column list.
+        :param col_name: Name of the column to be removed.
+        """
+        self.columns.pop(col_name, None)
+
+
 class Table:
     """Container class for structured data in table format. Data added in rows, but can be accessed by column name."""
 
     def __init__(self,
                  column_names: Union[str, List[str]],
-                 content_list: Union[List[List[str]], List[Dict[str, Any]], None] = None):
-        """Constructor of Table object
+                 content_list: Union[List[List[str]], List[Dict[str, Any]], None] = None,
+                 index_columns: Optional[List[str]] = None):
+        """Constructor of Table object. Content is stored in one list per column, rows are provided as TableRow views.
         :param column_names: Headline, naming the columns of the table.
         :param content_list: Table content.
+        :param index_columns: Columns to keep a hash index for, to speed up query(). Values have to be hashable.
         """
         if not isinstance(column_names, (list, str)):  # Check type
             raise TypeError('The first attribute of table() has to be of type list or string!')
@@ -262,8 +451,13 @@ class Table:
             raise AttributeError('The first attribute of table object can\'t contain duplicates!')
         else:
             self._head = column_names  # type: List[str]
+        self._table = ColumnStore(self._head, self._update_indexes)
+        self._column_indexes = {}  # type: Dict[str, Dict[Any, List[int]]]
+        if index_columns is not None:
+            for index_column in index_columns:
+                self.add_index(index_column)
         if content_list is not None:  # Process content given at initialization
-            if not all(map(lambda x: isinstance(x, (list, dict)), content_list)):  # Check types
+            if not all(map(lambda x: isinstance(x, (list, Mapping)), content_list)):  # Check types
                 raise TypeError('The second attribute of table() has to be None or a list of lists or dictionaries!')
             if any(map(lambda x: len(x) < len(column_names), content_list)):  # Check lengths of items
                 raise AttributeError('The second attribute of table() has to be a list of lists or dictionaries, '
@@ -276,16 +470,13 @@ class Table:
                     else:
                         # Convert list of uniform lists to list of uniform dictionaries
                         self.add(dict(zip(self._head, row)))
-            elif all(map(lambda x: isinstance(x, dict), content_list)):  # Process list of dictionaries
-                self._table = []
+            elif all(map(lambda x: isinstance(x, Mapping), content_list)):  # Process list of dictionaries
                 for row_dict in content_list:  # type: Dict[str, Any]
                     self.add(row_dict)
             else:  # Something is very wrong, if we get here
                 raise AttributeError('The attribute "content_list", if not None, has to be '
                                      'a list of ONLY lists or '
                                      'a list of ONLY dictionaries!')
-        else:
-            self._table = []
 
     def __repr__(self) -> str:
         """Magic method, called when Table object is printed
@@ -308,13 +499,11 @@ class Table:
     def __getitem__(self, col: str) -> List[Any]:
         """Magic method, called by []-accessor
         :param col: Column name, has to be in "_head".
-        :return: Content of column, which name is matching "col".
+        :return: Content of column, which name is matching "col". This is the column list itself and must not be
+        modified.
         """
         if col in self._head:
-            output = []  # type: List[Any]
-            for table_row in self._table:
-                output.append(table_row[col])
-            return output
+            return self._table.columns[col]
         else:
             raise AttributeError(f'Table has no column named "{col}"')
 
@@ -354,7 +543,7 @@ class Table:
         """Method to add row to Table object.
         :param row: Row to be added to table. May have content beyond the needed keys.
         """
-        if not isinstance(row, dict):  # Check Type
+        if not isinstance(row, Mapping):  # Check Type
             raise TypeError('table.add() expects a dictionary as argument')
         if len(row) < len(self._head):  # Check length
             raise ValueError(f'The argument of add_row has to be a dictionary with the length of at least '
@@ -366,8 +555,50 @@ class Table:
             except KeyError:  # If row misses a key
                 raise AttributeError('The dictionary given to table.add() misses at least one key, '
                                      'defined in the first attribute of table()!')
+        for col, col_index in self._column_indexes.items():  # Keep hash indexes up to date
+            col_index.setdefault(new_row[col], []).append(len(self._table))
         self._table.append(new_row)
 
+    def _update_indexes(self, row_number: int, col: str, old_value: Any, new_value: Any):
+        """Keeps the hash index of a column up to date, when a field of a row was changed.
+        :param row_number: Position of the changed row
+        :param col: Name of the changed column
+        :param old_value: Value before the change
+        :param new_value: Value after the change
+        """
+        col_index = self._column_indexes.get(col)
+        if col_index is None:
+            return
+        row_numbers = col_index.get(old_value, [])
+        if row_number in row_numbers:
+            row_numbers.remove(row_number)
+            if not row_numbers:
+                del col_index[old_value]
+        bisect.insort(col_index.setdefault(new_value, []), row_number)
+
+    def add_index(self, col_name: str):
+        """Method to build a hash index over a column, which is kept up to date by add(), remove_column() and writes
+        to the rows. Indexed columns are looked up in constant time by query().
+        :param col_name: Name of the column to be indexed.
+        """
+        if not isinstance(col_name, str):
+            raise TypeError('Attribute "col_name" of method "add_index" has to be of type string.')
+        if col_name not in self._head:
+            raise AttributeError('Attribute "col_name" of method "add_index" is not a column in Table object.')
+        col_index = {}  # type: Dict[Any, List[int]]
+        for row_number, table_row in enumerate(self._table):
+            col_index.setdefault(table_row[col_name], []).append(row_number)
+        self._column_indexes[col_name] = col_index
+
+    def _reorder(self, row_order: List[int]):
+        """Rearranges the rows of the table and rebuilds the hash indexes.
+        :param row_order: Row numbers in their new order
+        """
+        for column in self._table.columns.values():
+            column[:] = [column[row_number] for row_number in row_order]
+        for col_name in self._column_indexes:
+            self.add_index(col_name)
+
     def remove_column(self, col_name: str):
         """Method to remove column by column name
         :param col_name: Name of the column to be removed.
@@ -377,29 +608,38 @@ class Table:
         if col_name not in self._head:
             raise AttributeError('Attribute "col_name" of method "remove_column" is not a column in Table object.')
         self._head.remove(col_name)
-        for entry in self._table:
-            entry.pop(col_name, None)
+        self._column_indexes.pop(col_name, None)
+        self._table.remove_column(col_name)
 
-    def query(self, pattern: Union[Dict[str, Any], str]) -> Union[List[Dict[str, Any]], None]:
+    def query(self,
+              pattern: Union[Dict[str, Any], str],
+              use_index: bool = True) -> Union[List[Dict[str, Any]], None]:
         """Method to search the table for either all rows with a field matching pattern string or all rows where the
         content of column, defined in pattern dictionary, matches the value, associated in dictionary.
         :param pattern: Search pattern, either as string, searched in all columns,
         or dictionaries, defining column and object to be searched as key/value pairs.
+        :param use_index: If False, hash indexes are ignored and the table is searched linearly.
         :return: List of dictionaries, holding the result of the query, or None, if nothing was found
         """
         result = []
         if not isinstance(pattern, (dict, str)):
             raise TypeError('table.query() takes a dict or a string as argument!')
         elif isinstance(pattern, dict):
-            result += self._table
             for pattern_key in pattern:
-                if pattern_key in self._head:
-                    result = list(filter(lambda x: x[pattern_key] == pattern[pattern_key], result))
-                else:
+                if pattern_key not in self._head:
                     raise ValueError(f'{pattern_key} is not a column in table!')
+            indexed_keys = [key for key in pattern if key in self._column_indexes] if use_index else []
+            if indexed_keys:  # Narrow down candidates by the most selective index
+                row_numbers = min((self._column_indexes[key].get(pattern[key], []) for key in indexed_keys), key=len)
+            else:
+                row_numbers = range(len(self._table))
+            for pattern_key in pattern:  # Compare column lists directly, to avoid creating a row view per comparison
+                column = self._table.columns[pattern_key]
+                row_numbers = [n for n in row_numbers if column[n] == pattern[pattern_key]]
+            result += [self._table[row_number] for row_number in row_numbers]
         elif isinstance(pattern, str):
-            for head_key in self._head:
-                result += list(filter(lambda x: x[head_key] == pattern, self._table))
+            for column in self._table.columns.values():
+                result += [self._table[n] for n, value in enumerate(column) if value == pattern]
         if not result:
             return None
         else:
@@ -415,7 +655,7 @@ class DbFile(Table):
         :param macro_reserve: Number of characters, reserved in PV name to be filled by macro-expansion
         :param logging: Object with 'write()' method, i.e. Logger or sys.stderr
         """
-        super().__init__(['devicePath', 'pvName', 'recordType', 'fields'], None)
+        super().__init__(['devicePath', 'pvName', 'recordType', 'fields'], None, index_columns=['devicePath'])
         if not callable(getattr(logging, 'write')):
             raise AttributeError('Attribute "logging" of PVDb object has to be an object with a "write" method!')
         else:
@@ -442,30 +682,23 @@ class DbFile(Table):
         if not query_result:  # Check existence
             self.log.write(f'{AsciiFormat.error}PV with device path {pv_id} does not exist in PVDb!')
         elif len(query_result) == 1:  # Usual case
-            index = self._table.index(query_result[0])
-            return self._table[index]
+            return query_result[0]
         elif len(query_result) > 1:  # Check Multiple Entries
             self.log.write(f'{AsciiFormat.error}Multiple PVs with device path {pv_id} found in PVDb!'
                            f' PVDb might be corrupted!')
-            index = self._table.index(query_result[0])
-            return self._table[index]
+            return query_result[0]
         else:  # For unforeseen cases
             raise RuntimeError('Something has gone wrong!')
 
-    def _remove_macros(self, in_str: str) -> str:
-        """Recursively remove Macros from input
+    @staticmethod
+    def _remove_macros(in_str: str) -> str:
+        """Remove all EPICS macros "$(...)" from input in a single pass
         :param in_str: String to remove macros from.
-        :return: String with macro found first, removed.
+        :return: String with all macros removed.
         """
         if not isinstance(in_str, str):
             raise TypeError('Attribute of method "_remove_macros" has to be of type string!')
-        open_pos = in_str.find('$(')
-        if open_pos == -1:  # End recursion
-            return in_str
-        else:
-            close_pos = in_str.find(')', open_pos) + 1
-            output = in_str[:open_pos] + in_str[close_pos:]
-            return self._remove_macros(output)
+        return EPICS_MACRO_PATTERN.sub('', in_str)
 
     def add(self, record: Dict[str, Any]):
         """Adds EPICS record to database, including some checking for compliance with EPICS.
@@ -546,26 +779,84 @@ class DbFile(Table):
         # Call add of class Table, to add
         super().add(record)
 
+    def scan_summary(self) -> Dict[str, Dict[str, int]]:
+        """Summarises the records by value of their SCAN field, to estimate the load of the IOC.
+        :return: Number of records, of array elements and of bytes sent to a Channel Access client, when every record
+        with this SCAN value is processed once, by SCAN value
+        """
+        summary = {}  # type: Dict[str, Dict[str, int]]
+        for pv in self._table:
+            fields = pv['fields']
+            try:
+                elements = max(int(fields.get('NELM', 1)), 1)
+            except ValueError:  # Unexpanded macro
+                elements = 1
+            if 'SIZV' in fields and str(fields['SIZV']).isdigit():
+                element_size = int(fields['SIZV'])
+            else:
+                element_size = EPICS_ELEMENT_SIZES.get(fields.get('FTVL'),
+                                                       EPICS_ELEMENT_SIZES.get(pv['recordType'], 8))
+            scan_entry = summary.setdefault(fields.get('SCAN', 'Passive'), {'records': 0, 'elements': 0, 'bytes': 0})
+            scan_entry['records'] += 1
+            scan_entry['elements'] += elements
+            scan_entry['bytes'] += CA_UPDATE_OVERHEAD + elements * element_size
+        return summary
+
     def write_db_file(self, source: Optional[str] = None):
-        """Generate EPICS db file from database
+        """Generate EPICS db file from database. Records are streamed into a temporary file, which replaces the db file
+        when complete, so the db file is never read half-written.
+        :param source: Config file used for generation, for comment at head of file.
+        """
+        write_file_atomically(self.file_path, self._db_file_lines(_relative_source(source, self.file_path)))
+
+    def write_combined_db_file(self,
+                               file_path: str,
+                               loop: str,
+                               macros: Dict[str, str],
+                               source: Optional[str] = None):
+        """Generate a db file holding all instances of the database, i.e. one per motor, so the IOC loads and parses
+        a single file. The records are placed in a mako for-loop, rendered by ConfigGenerator, and the EPICS macros,
+        which differ between instances, are replaced by mako expressions.
+        :param file_path: Path to write the combined db-file to
+        :param loop: Head of the mako for-loop, i.e. 'i, motor in motor_cfg.motors.items()'
+        :param macros: Mako expression by EPICS macro name, i.e. {'Motor': '${motor.name}'}
         :param source: Config file used for generation, for comment at head of file.
         """
-        # Assemble file content as one string
-        out_str = f'##mako -*- coding: utf-8 -*-\n# File generated by dbGenerator version {str(VERSION)}'
+        write_file_atomically(os.path.abspath(file_path),
+                              self._db_file_lines(_relative_source(source, file_path), loop, macros))
+
+    def _db_file_lines(self,
+                       source: Optional[str] = None,
+                       loop: Optional[str] = None,
+                       macros: Optional[Dict[str, str]] = None) -> Iterator[str]:
+        """Generator, providing the content of the db file record by record
+        :param source: Config file used for generation, for comment at head of file. Relative to the db file, so the
+        header does not depend on the location of the checkout.
+        :param loop: Head of a mako for-loop around all records, see write_combined_db_file()
+        :param macros: Mako expression by EPICS macro name, replacing the macros in the records
+        :return: File header, followed by one string per record
+        """
+        header = f'##mako -*- coding: utf-8 -*-\n# File generated by dbGenerator version {str(VERSION)}'
         if source is not None:
-            out_str += f' from configuration file:\n# "{source}"\n'
+            header += f' from configuration file:\n# "{source}"\n'
         else:
-            out_str += '.\n'
-        out_str += '# Do not change the content of this file!\n\n'
+            header += '.\n'
+        yield header + '# Do not change the content of this file!\n\n'
+        if loop is not None:
+            yield f'% for {loop}:\n'
+        macro_pattern = re.compile(r'\$[({](' + '|'.join(map(re.escape, macros)) + r')[)}]') if macros else None
         for pv in self._table:
+            if macro_pattern is not None:  # Replace macros "$(name)" and "${name}" by their mako expressions
+                pv = {'recordType': pv['recordType'],
+                      'pvName': macro_pattern.sub(lambda match: macros[match.group(1)], pv['pvName']),
+                      'fields': {field_name: macro_pattern.sub(lambda match: macros[match.group(1)], field_value)
+                                 for field_name, field_value in pv['fields'].items()}}
             record_fields = '    field(' + '")\n    field('.join(list(map(', "'.join, pv['fields'].items()))) + '")'
-            record_str = f'record({pv["recordType"]}, "{pv["pvName"]}"){{\n' \
-                         f'{record_fields}\n' \
-                         f'}}\n'
-            out_str += record_str + '\n'
-        # Write string to file
-        with open(self.file_path, 'w') as db_file:
-            db_file.write(out_str)
+            yield f'record({pv["recordType"]}, "{pv["pvName"]}"){{\n' \
+                  f'{record_fields}\n' \
+                  f'}}\n\n'
+        if loop is not None:
+            yield '% endfor\n'
 
 
 class XmlSource(Table):
@@ -592,29 +883,18 @@ class XmlSource(Table):
                           'numberOfElements',
                           'direction',
                           'unit',
-                          'description'])
+                          'description'],
+                         index_columns=['address'])
         self.namespace = '{https://github.com/ChimeraTK/ApplicationCore}'
-        self._index = []
         if aliases is None:
             self.aliases = {}
         else:
             self.aliases = aliases
         self.file = os.path.abspath(xml_filepath)
-        try:
-            self._tree = xmlEleTree.parse(self.file)
-        except FileNotFoundError:
-            raise SourceLoadError(f'{AsciiFormat.error}File "{self.file}" not found!')
-        except xmlEleTree.ParseError:
-            raise SourceLoadError(f'{AsciiFormat.error}File "{self.file}" can not be parsed! Corrupt/not xml file?')
-        self._root = self._tree.getroot()
-        if self._root.tag != f'{self.namespace}application':
-            raise SourceLoadError(f'{AsciiFormat.error}File "{self.file}" seems not to be a ChimeraTK variable file!')
-        self.application = self._root.get('name')
-        self._make_index(self._root)
-        # Extract Information from source xml
-        for variable in self._index:
-            var_path = variable['var_path']
-            var_name = variable['var_name']
+        self.application = None
+        # Extract Information from source xml. Rows are added as the variables are parsed, and put in order once
+        order_keys = []  # Sort key per row, see _stream_variables()
+        for order_key, var_path, var_name, var_elements in self._stream_variables():
             var_data = {'value_type': None,
                         'unit': '',
                         'description': '',
@@ -623,8 +903,8 @@ class XmlSource(Table):
             try:  # To catch SkipLoop
                 for val_key in var_data:
                     try:
-                        var_data[val_key] = variable['xml_address'].find(self.namespace + val_key).text
-                    except AttributeError:
+                        var_data[val_key] = var_elements[val_key]
+                    except KeyError:
                         self.logger.write(f'{AsciiFormat.error}Attribute "{val_key}" not found in '
                                           f'{AsciiFormat.bold(var_path + var_name)}!')
                         if val_key in ['direction', 'numberOfElements']:
@@ -643,6 +923,10 @@ class XmlSource(Table):
                 'description': var_data['description'],
                 'numberOfElements': int(var_data['numberOfElements'])
             })
+            order_keys.append(order_key)
+        row_order = sorted(range(len(order_keys)), key=order_keys.__getitem__)
+        if row_order != list(range(len(order_keys))):
+            self._reorder(row_order)
 
     def __getitem__(self, search_str: str) -> Dict[str, Any]:
         """Magic method, provides []-accessor.
@@ -655,27 +939,63 @@ class XmlSource(Table):
         if query_result is None:  # Check existence
             self.logger.write(f'{AsciiFormat.error}Entry with Address {search_str} does not exist in XmlSource')
         elif len(query_result) == 1:  # Usual case
-            index = self._table.index(query_result[0])
-            return self._table[index]
+            return query_result[0]
         elif len(query_result) > 1:  # Check Multiple Entries
             self.logger.write(f'{AsciiFormat.error}Multiple entries with ID {search_str} found in XmlSource!'
                               f' Database is corrupted!')
-            index = self._table.index(query_result[0])
-            return self._table[index]
+            return query_result[0]
         else:  # For unforeseen cases
             raise RuntimeError('Something has gone wrong!')
 
-    def _make_index(self, xml_node: Any, pv_path: str = ''):
-        """Recursive method to iterate through the xml tree and isolate the 'variables'
-        while maintaining the path in order to generate an index.
-        :param xml_node: xml node to recurse over
-        :param pv_path: Path to the node, from which the function is called.
+    def _stream_variables(self) -> Iterator[tuple]:
+        """Parses the xml file incrementally and provides the 'variables' as soon as they are closed, while maintaining
+        the directory path on a stack. Elements are removed from the tree as soon as they are processed, so only the
+        currently open branch is held in memory.
+        :return: Iterator over tuples, holding sort key, path, name and a dictionary with the text of the child elements
+        per variable. Sorted by the key, the variables of a directory are listed before those of its subdirectories.
         """
-        for v in xml_node.findall(self.namespace + 'variable'):
-            self._index.append({'xml_address': v, 'var_path': pv_path, 'var_name': v.get('name')})
-        for d in xml_node.findall(self.namespace + 'directory'):
-            self._make_index(d, pv_path=pv_path + d.get('name') + '/')
-        return  # Break recursion, if no more directories found
+        variable_tag = self.namespace + 'variable'
+        directory_tag = self.namespace + 'directory'
+        open_elements = []  # Stack of all currently open xml elements
+        # Stack of open directories: [xml element, path, sort key]. The sort key holds the numbers of the directory and
+        # its parents in order of appearance, the root directory has the empty key.
+        directories = []  # type: List[List[Any]]
+        number_of_directories = 0
+        number_of_variables = 0
+        try:
+            for event, element in xmlEleTree.iterparse(self.file, events=('start', 'end')):
+                if event == 'start':
+                    if not open_elements:  # Root element
+                        if element.tag != f'{self.namespace}application':
+                            raise SourceLoadError(f'{AsciiFormat.error}File "{self.file}" seems not to be a '
+                                                  f'ChimeraTK variable file!')
+                        self.application = element.get('name')
+                        directories.append([element, '', ()])
+                    elif element.tag == directory_tag and open_elements[-1] is directories[-1][0]:
+                        number_of_directories += 1
+                        directories.append([element, f'{directories[-1][1]}{element.get("name")}/',
+                                            directories[-1][2] + (number_of_directories,)])
+                    open_elements.append(element)
+                    continue
+                open_elements.pop()
+                if not open_elements:  # Root element closed
+                    break
+                if element.tag == variable_tag and open_elements[-1] is directories[-1][0]:
+                    var_elements = {child.tag[len(self.namespace):]: child.text for child in element
+                                    if child.tag.startswith(self.namespace)}
+                    number_of_variables += 1
+                    # Directory numbers start at 1, so 0 sorts the variables before the subdirectories
+                    yield directories[-1][2] + (0, number_of_variables), directories[-1][1], element.get('name'), \
+                        var_elements
+                elif element is directories[-1][0]:
+                    directories.pop()
+                else:
+                    continue
+                open_elements[-1].remove(element)  # Free processed elements
+        except FileNotFoundError:
+            raise SourceLoadError(f'{AsciiFormat.error}File "{self.file}" not found!')
+        except xmlEleTree.ParseError:
+            raise SourceLoadError(f'{AsciiFormat.error}File "{self.file}" can not be parsed! Corrupt/not xml file?')
 
     def __add(self, row: Dict[str, Any]):
         """To bend add method of parent class to hidden method"""
@@ -694,8 +1014,132 @@ class XmlSource(Table):
         return super().__getitem__(column_head)
 
 
+class GenerationCache:
+    """Class to keep track of the inputs, output files were generated from, in a json file next to the config file.
+    Allows to skip output files, whose inputs did not change since the last run."""
+
+    def __init__(self, cache_path: str, logger: Any = sys.stderr):
+        """
+        :param cache_path: Path to the cache file. It is created on save(), if it does not exist.
+        :param logger: Object with "write" method, i.e. sys.stderr or Logging-class object
+        """
+        self.file_path = os.path.abspath(cache_path)
+        self.logger = logger
+        self.clear()
+        if os.path.isfile(self.file_path):
+            try:
+                with open(self.file_path, 'r', encoding='utf-8') as cache_file:
+                    content = json.load(cache_file)
+            except (OSError, ValueError):
+                self.logger.write(f'{AsciiFormat.warning}Cache file "{self.file_path}" can not be read! '
+                                  f'All output files will be generated.')
+                return
+            if isinstance(content, dict) and content.get('version') == VERSION:
+                self._content = content
+
+    @staticmethod
+    def content_hash(*parts: Union[str, bytes]) -> str:
+        """Hashes the given strings and byte strings as one sequence.
+        :param parts: Content to be hashed
+        :return: Hash as hex string
+        """
+        content_hash = hashlib.sha256()
+        for part in parts:
+            if not isinstance(part, bytes):
+                part = str(part).encode('utf-8')
+            content_hash.update(len(part).to_bytes(8, 'little'))  # Length prefix keeps part boundaries distinct
+            content_hash.update(part)
+        return content_hash.hexdigest()
+
+    @staticmethod
+    def file_hash(file_path: str) -> str:
+        """Hashes the content of a file.
+        :param file_path: Path to the file
+        :return: Hash as hex string
+        """
+        content_hash = hashlib.sha256()
+        with open(file_path, 'rb') as hashed_file:
+            for chunk in iter(lambda: hashed_file.read(1 << 16), b''):
+                content_hash.update(chunk)
+        return content_hash.hexdigest()
+
+    def clear(self):
+        """Forgets all cached entries."""
+        self._content = {'version': VERSION, 'outputs': {}, 'report': {'key': None, 'unprocessed': {}}}
+
+    def output_up_to_date(self, output_path: str, output_key: str) -> bool:
+        """Checks, if an output file was generated from the same inputs and all files written for it still exist.
+        :param output_path: Path of the db-file, as defined in the config file
+        :param output_key: Hash of the inputs of the output file
+        :return: True, if the output file does not need to be generated
+        """
+        entry = self._content['outputs'].get(os.path.abspath(output_path))
+        if entry is None or entry['key'] != output_key or 'scanSummary' not in entry:
+            return False
+        return all(map(os.path.isfile, entry['files']))
+
+    def used_entries(self, output_path: str) -> Dict[str, List[str]]:
+        """Provides the source entries, used by an output file when it was generated.
+        :param output_path: Path of the db-file, as defined in the config file
+        :return: Used source entries by source label
+        """
+        entry = self._content['outputs'].get(os.path.abspath(output_path))
+        return {} if entry is None else entry['usedEntries']
+
+    def scan_summary(self, output_path: str) -> Dict[str, Dict[str, int]]:
+        """Provides the scan summary of an output file, see DbFile.scan_summary().
+        :param output_path: Path of the db-file, as defined in the config file
+        :return: Scan summary, empty if the output file was not generated
+        """
+        entry = self._content['outputs'].get(os.path.abspath(output_path))
+        return {} if entry is None else entry.get('scanSummary', {})
+
+    def update_output(self,
+                      output_path: str,
+                      output_key: str,
+                      used_entries: Dict[str, List[str]],
+                      written_files: List[str],
+                      scan_summary: Dict[str, Dict[str, int]]):
+        """Stores the inputs and results of a generated output file.
+        :param output_path: Path of the db-file, as defined in the config file
+        :param output_key: Hash of the inputs of the output file
+        :param used_entries: Source entries used by the output file, by source label
+        :param written_files: Paths of all files written for the output file
+        :param scan_summary: Records by SCAN value, see DbFile.scan_summary()
+        """
+        self._content['outputs'][os.path.abspath(output_path)] = {'key': output_key,
+                                                                   'usedEntries': used_entries,
+                                                                   'files': written_files,
+                                                                   'scanSummary': scan_summary}
+
+    @property
+    def report_key(self) -> Optional[str]:
+        """Hash of the inputs of the cached list of unprocessed source entries."""
+        return self._content['report']['key']
+
+    @property
+    def unprocessed(self) -> Dict[str, List[str]]:
+        """Cached list of unprocessed source entries by source label."""
+        return self._content['report']['unprocessed']
+
+    def update_report(self, report_key: str, unprocessed: Dict[str, List[str]]):
+        """Stores the list of unprocessed source entries.
+        :param report_key: Hash of the config file, the source files and the generator version
+        :param unprocessed: Unprocessed source entries by source label
+        """
+        self._content['report'] = {'key': report_key, 'unprocessed': unprocessed}
+
+    def save(self):
+        """Writes cache to file."""
+        try:
+            write_file_atomically(self.file_path, json.JSONEncoder(indent=1).iterencode(self._content), 'utf-8')
+        except OSError:
+            self.logger.write(f'{AsciiFormat.warning}Cache file "{self.file_path}" can not be written!')
+
+
 class EpicsCfg:
     """Class to read, process and generate EPICS config files"""
+    _compiled_templates = {}  # type: Dict[str, List[Tuple[int, str]]]
 
     def __init__(self, cfg_file_path: str, logger: Any = sys.stderr):
         """
@@ -712,8 +1156,11 @@ class EpicsCfg:
         if not os.path.isdir(self._cfg_dir):
             raise AttributeError(f'{self._cfg_dir} is not a valid path to an existing directory!')
         self.file_path = cfg_file_path
+        self._cache_path = f'{self._cfg_abspath}.cache'
         self._sources = {}
-        self._remaining_source_entries = {}
+        # Unused entries by source label. Dicts without values, to remove entries in constant time and keep their order
+        self._remaining_source_entries = {}  # type: Dict[str, Dict[str, None]]
+        self._scan_classes = {}  # type: Dict[str, str]
 
     def load_source(self, source_path: str, source_label: str, source_type: str = 'xml-variables', **kwargs):
         """Adds content of source file to source-database
@@ -739,17 +1186,24 @@ class EpicsCfg:
                 # Generate source database
                 self._sources[source_label] = XmlSource(source_path, logger=self.logger, aliases=source_aliases)
                 # Populate _remaining_source_entries
-                self._remaining_source_entries[source_label] = self._sources[source_label].column('address')
+                self._remaining_source_entries[source_label] = \
+                    dict.fromkeys(self._sources[source_label].column('address'))
             except SourceLoadError as error:
                 self.logger.write(error.message)
         else:
             raise AttributeError('Source type "' + str(source_type) + '" is unknown!')
 
-    def generate_config_file(self, source_label: str, macro: Optional[str] = None, macro_length: Optional[int] = 0):
+    def generate_config_file(self,
+                             source_label: str,
+                             macro: Optional[str] = None,
+                             macro_length: Optional[int] = 0,
+                             io_intr: bool = False):
         """Method to generate simple config xml file as a blank.
         :param source_label: Label of the xml-source, to access it in self.sources-dictionary
         :param macro: Macro to be added to all PVs
         :param macro_length: Length to be reserved in pv name for macro
+        :param io_intr: If True, input records are processed when the application pushes a new value (SCAN=I/O Intr),
+        instead of being polled once per second.
         """
         gen_log = Logging(source_label + 'CfgGen.log')  # Generate separate log file
         gen_log.write('Start of config file generation.')
@@ -855,32 +1309,80 @@ class EpicsCfg:
                                      'bi': 'false',
                                      'mbboDirect': 'true',
                                      'mbbiDirect': 'false'}
-        # Determine value of SCAN field, depending on record type
-        pv_scan_determination = {'int64out': 'Passive',
-                                 'int64in': '1 second',
-                                 'ao': 'Passive',
-                                 'ai': '1 second',
-                                 'longout': 'Passive',
-                                 'longin': '1 second',
-                                 'aao': 'Passive',
-                                 'aai': '1 second',
-                                 'lso': 'Passive',
-                                 'lsi': '1 second',
-                                 'bo': 'Passive',
-                                 'bi': '1 second',
-                                 'mbboDirect': 'Passive',
-                                 'mbbiDirect': '1 second'}
-        pvs = Table(['pvName', 'devicePath', 'recordType', 'autosave', 'fields'])
+        # Determine scan class, depending on record type. Values of the scan classes are defined in the config file,
+        # so all recordgroups of a class can be rescanned at once.
+        pv_scan_determination = {'int64out': 'output',
+                                 'int64in': 'input',
+                                 'ao': 'output',
+                                 'ai': 'input',
+                                 'longout': 'output',
+                                 'longin': 'input',
+                                 'aao': 'output',
+                                 'aai': 'input',
+                                 'lso': 'output',
+                                 'lsi': 'input',
+                                 'bo': 'output',
+                                 'bi': 'input',
+                                 'mbboDirect': 'output',
+                                 'mbbiDirect': 'input'}
+        # Variables from the application to the control system are pushed by ChimeraTK, so input records can be
+        # processed on each update instead of being polled.
+        scan_classes = {'input': 'I/O Intr' if io_intr else '1 second',
+                        'output': 'Passive'}
+        # Fields of each record type, built once and shared by all records of that type. Must not be mutated.
+        pv_fields_determination = {
+            'int64out': {'OUT': '@$(APP) +{:address}',
+                         'EGU': '+{:unit}',
+                         'PINI': '1'},
+            'int64in': {'INP': '@$(APP) +{:address}',
+                        'EGU': '+{:unit}'},
+            'ao': {'OUT': '@$(APP) +{:address}',
+                   'EGU': '+{:unit}',
+                   'PINI': '1'},
+            'ai': {'INP': '@$(APP) +{:address}',
+                   'EGU': '+{:unit}'},
+            'longout': {'OUT': '@$(APP) +{:address}',
+                        'EGU': '+{:unit}',
+                        'PINI': '1'},
+            'longin': {'INP': '@$(APP) +{:address}',
+                       'EGU': '+{:unit}'},
+            'lso': {'OUT': '@$(APP) +{:address}',
+                    'PINI': '1'},
+            'lsi': {'INP': '@$(APP) +{:address}'},
+            'aao': {'OUT': '@$(APP) +{:address}',
+                    'EGU': '+{:unit}',
+                    'FTVL': '+{:value_type}',
+                    'NELM': '+{:numberOfElements}',
+                    'PINI': '1'},
+            'aai': {'INP': '@$(APP) ' + '+{:address}',
+                    'EGU': '+{:unit}',
+                    'FTVL': '+{:value_type}',
+                    'NELM': '+{:numberOfElements}'},
+            'bo': {'OUT': '@$(APP) +{:address}',
+                   'ZNAM': 'False',
+                   'ONAM': 'True',
+                   'PINI': '1'},
+            'bi': {'INP': '@$(APP) +{:address}',
+                   'ZNAM': 'False',
+                   'ONAM': 'True'},
+            'mbboDirect': {'OUT': '@$(APP) +{:address}',
+                           'NOBT': '+{:numberOfElements}'},
+            'mbbiDirect': {'INP': '@$(APP) +{:address}',
+                           'NOBT': '+{:numberOfElements}'}
+        }
+        # Resolve direction, array-ness and value type to the record type in a single lookup
+        record_type_lookup = {}  # type: Dict[Tuple[str, bool, str], str]
+        for direction, io_type in pv_direction_determination.items():
+            for value_type, epics_type in pv_type_conversion.items():
+                for is_array in (False, True):
+                    record_type_lookup[(direction, is_array, value_type)] = \
+                        pv_type_determination[io_type + str(is_array) + epics_type]
         # Generate aliases from xml path
         gen_log.write('Generate aliases')
 
         # Prune all branches in the variable tree, which have less than 5 leafs.
-        paths = []
-        branches = xml_source.column('variablePath')
-        for branch in list(set(branches)):  # list(set(list)) to remove duplicates
-            number_of_branches = branches.count(branch)
-            if number_of_branches > 4:
-                paths.append(branch)
+        branch_count = Counter(xml_source.column('variablePath'))
+        paths = [branch for branch, number_of_branches in branch_count.items() if number_of_branches > 4]
 
         aliases = {}
         for path in paths:
@@ -894,89 +1396,34 @@ class EpicsCfg:
             aliases[f'{"/".join(words)}/'] = ''.join(surrogate_parts)
 
         gen_log.write('Compile data from xml.')
-        for entry in xml_source:  # Build database
+        pv_macro = f'$({macro})' if macro is not None else ''
+        record_groups = {}  # type: Dict[str, List[Dict[str, Any]]]
+        for entry in xml_source:  # Build database, grouped by record type in order of first appearance
             if entry['value_type'] in ['Void', 'unknown']:  # Skip Void-Type/Unknown Variables/Registers
                 gen_log.write(f'{entry["variablePath"]}{entry["variableName"]} is of type {entry["value_type"]}: '
                               f'No record was created!')
                 continue
-            try:  # Try to resolve aliases
-                pv_device_address = f'+\u007b{aliases[entry["variablePath"]]}\u007d{entry["variableName"]}'
-            except KeyError:
-                pv_device_address = entry['address']
-            pv_recordtype = pv_type_determination[pv_direction_determination[entry['direction']]
-                                                  + str(entry['numberOfElements'] > 1)
-                                                  + pv_type_conversion[entry['value_type']]]
-            pv_fields_determination = {
-                'int64out': {'SCAN': pv_scan_determination[pv_recordtype],
-                             'OUT': '@$(APP) +{:address}',
-                             'EGU': '+{:unit}',
-                             'PINI': '1'},
-                'int64in': {'SCAN': pv_scan_determination[pv_recordtype],
-                            'INP': '@$(APP) +{:address}',
-                            'EGU': '+{:unit}'},
-                'ao': {'SCAN': pv_scan_determination[pv_recordtype],
-                       'OUT': '@$(APP) +{:address}',
-                       'EGU': '+{:unit}',
-                       'PINI': '1'},
-                'ai': {'SCAN': pv_scan_determination[pv_recordtype],
-                       'INP': '@$(APP) +{:address}',
-                       'EGU': '+{:unit}'},
-                'longout': {'SCAN': pv_scan_determination[pv_recordtype],
-                            'OUT': '@$(APP) +{:address}',
-                            'EGU': '+{:unit}',
-                            'PINI': '1'},
-                'longin': {'SCAN': pv_scan_determination[pv_recordtype],
-                           'INP': '@$(APP) +{:address}',
-                           'EGU': '+{:unit}'},
-                'lso': {'SCAN': pv_scan_determination[pv_recordtype],
-                        'OUT': '@$(APP) +{:address}',
-                        'PINI': '1'},
-                'lsi': {'SCAN': pv_scan_determination[pv_recordtype],
-                        'INP': '@$(APP) +{:address}'},
-                'aao': {'SCAN': pv_scan_determination[pv_recordtype],
-                        'OUT': '@$(APP) +{:address}',
-                        'EGU': '+{:unit}',
-                        'FTVL': '+{:value_type}',
-                        'NELM': '+{:numberOfElements}',
-                        'PINI': '1'},
-                'aai': {'SCAN': pv_scan_determination[pv_recordtype],
-                        'INP': '@$(APP) ' + '+{:address}',
-                        'EGU': '+{:unit}',
-                        'FTVL': '+{:value_type}',
-                        'NELM': '+{:numberOfElements}'},
-                'bo': {'SCAN': pv_scan_determination[pv_recordtype],
-                       'OUT': '@$(APP) +{:address}',
-                       'ZNAM': 'False',
-                       'ONAM': 'True',
-                       'PINI': '1'},
-                'bi': {'SCAN': pv_scan_determination[pv_recordtype],
-                       'INP': '@$(APP) +{:address}',
-                       'ZNAM': 'False',
-                       'ONAM': 'True'},
-                'mbboDirect': {'SCAN': pv_scan_determination[pv_recordtype],
-                               'OUT': '@$(APP) +{:address}',
-                               'NOBT': '+{:numberOfElements}'},
-                'mbbiDirect': {'SCAN': pv_scan_determination[pv_recordtype],
-                               'INP': '@$(APP) +{:address}',
-                               'NOBT': '+{:numberOfElements}'}
-            }
-            # Construct macro
-            pv_macro = f'$({macro})' if macro is not None else ''
-            if entry['variablePath'] in aliases:
-                pv_name_path = f'{aliases[entry["variablePath"]]}/'
+            alias = aliases.get(entry['variablePath'])
+            if alias is not None:
+                pv_device_address = f'+\u007b{alias}\u007d{entry["variableName"]}'
+                pv_name = f'{alias}/{entry["variableName"]}'
             else:
-                pv_name_path = entry['variablePath']
-            pv_name = pv_name_path + entry['variableName']
+                pv_device_address = entry['address']
+                pv_name = entry['variablePath'] + entry['variableName']
+            pv_recordtype = record_type_lookup[(entry['direction'],
+                                                entry['numberOfElements'] > 1,
+                                                entry['value_type'])]
             if len(pv_name) > 39 - macro_length:
                 gen_log.write(f'PV name "{pv_macro}{pv_name}" is too long.')
-            pvs.add({'devicePath': f'{xml_source.application}.{pv_device_address}',
-                     'pvName': pv_macro + pv_name,
-                     'recordType': pv_recordtype,
-                     'autosave': pv_autosave_determination[pv_recordtype],
-                     'fields': pv_fields_determination[pv_recordtype]})
+            record_groups.setdefault(pv_recordtype, []).append(
+                {'devicePath': f'{xml_source.application}.{pv_device_address}',
+                 'pvName': pv_macro + pv_name,
+                 'fields': pv_fields_determination[pv_recordtype]})
         gen_log.write('Compile config file.')
         cfg_xmlns = 'https://github.com/ChimeraTK/ControlSystemAdapter-EPICS-IOC-Adapter'
         cfg_xml_root = xmlEleTree.Element('EPICSdb', xmlns=cfg_xmlns, application=xml_source.application)
+        for scan_class_name, scan_class_value in scan_classes.items():
+            xmlEleTree.SubElement(cfg_xml_root, 'scanclass', name=scan_class_name, value=scan_class_value)
         cfg_xml_source = xmlEleTree.SubElement(cfg_xml_root, 'sourcefile',
                                                type='xml-variables',
                                                path=xml_source.file,
@@ -994,54 +1441,72 @@ class EpicsCfg:
                                                   macroReserve=str(macro_length))
         # Set file generic 'fields'
         xmlEleTree.SubElement(cfg_xml_output_db, 'field', type='DTYP', value='ChimeraTK')
-        for rec_type in list(set(pvs['recordType'])):
+        for rec_type, records in record_groups.items():
             cfg_xml_recordtype = xmlEleTree.SubElement(cfg_xml_output_db, 'recordgroup',
                                                        type=rec_type,
-                                                       autosave=pv_autosave_determination[rec_type])
-            # Extract records of same type
-            records = Table(['devicePath', 'pvName', 'autosave', 'fields'],
-                            content_list=pvs.query({'recordType': rec_type}))
-            # Find default fields
-            record_fields = Table(list(records['fields'][0].keys()), records['fields'])  # type: Table
-            for field_name in record_fields.head:
-                field_val = record_fields[field_name]  # type: List[Any]
-                field_val_elements = list(set(field_val))
-                if len(field_val_elements) == 1:
-                    xmlEleTree.SubElement(cfg_xml_recordtype, 'field', type=field_name, value=field_val_elements[0])
-                    for record in records:
-                        record['fields'].pop(field_name, None)
+                                                       autosave=pv_autosave_determination[rec_type],
+                                                       scan=pv_scan_determination[rec_type])
+            # Find default fields: those with the same value in every record of the group
+            shared_fields = dict(records[0]['fields'])
+            for record in records:
+                fields = record['fields']
+                if fields is records[0]['fields']:
+                    continue
+                for field_name in [name for name, value in shared_fields.items() if fields.get(name) != value]:
+                    del shared_fields[field_name]
+            for field_name, field_value in shared_fields.items():
+                xmlEleTree.SubElement(cfg_xml_recordtype, 'field', type=field_name, value=field_value)
             for record in records:
                 cfg_xml_record = xmlEleTree.SubElement(cfg_xml_recordtype, 'record',
                                                        pvName=record['pvName'],
                                                        source=record['devicePath'])
-                fields = record['fields']
-                for field in fields:
-                    xmlEleTree.SubElement(cfg_xml_record, 'field', type=field, value=fields[field])
-        xml_list = []
-        xml_list_item = ''
-        for element in xmlEleTree.tostringlist(cfg_xml_root, encoding='unicode', method='xml'):
-            xml_list_item += element
-            if xml_list_item[-1] == '>':
-                xml_list.append(xml_list_item)
-                xml_list_item = ''
-        indent_level = 0
-        xml_str = '<?xml version="1.0" encoding="UTF-8"?>\n'
-        indent = '    '
-        for tag in xml_list:
-            if tag[:2] == '</':
-                indent_level -= 1
-            if indent_level < 0:
-                indent_level = 0
-            xml_str += indent_level * indent + tag + '\n'
-            if tag[-2:] != '/>' and tag[:2] != '</':
-                indent_level += 1
+                for field_name, field_value in record['fields'].items():
+                    if field_name not in shared_fields:
+                        xmlEleTree.SubElement(cfg_xml_record, 'field', type=field_name, value=field_value)
+        indent_xml(cfg_xml_root, space='    ')
         gen_log.write('Writing file: ' + self.file_path)
         with open(self.file_path, 'w', encoding='utf-8') as file:
-            file.write(xml_str)
+            file.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            xmlEleTree.ElementTree(cfg_xml_root).write(file, encoding='unicode', method='xml')
+            file.write('\n')
         gen_log.write('Config file generation complete!')
 
+    @classmethod
+    def _compile(cls, in_str: str) -> List[Tuple[int, str]]:
+        """Splits string into literal segments and the macros, placed between "+{" and "}", in a single pass.
+        Results are cached by string, as the same field templates are used for many records.
+        :param in_str: String to be compiled
+        :return: List of (segment type, content) tuples. Segment types are SEGMENT_LITERAL, SEGMENT_ALIAS for
+        "+{alias}" and SEGMENT_LINK for "+{:link}", with content being the literal text, alias or link name.
+        """
+        try:
+            return cls._compiled_templates[in_str]
+        except KeyError:
+            pass
+        segments = []  # type: List[Tuple[int, str]]
+        pos = 0
+        while True:
+            pos_open = in_str.find('+{', pos)
+            if pos_open == -1:
+                break
+            pos_close = in_str.find('}', pos_open + 2)
+            if pos_close == -1:  # Unterminated macro is kept as literal
+                break
+            if pos_open > pos:
+                segments.append((SEGMENT_LITERAL, in_str[pos:pos_open]))
+            macro_name = in_str[pos_open + 2:pos_close]
+            if macro_name[:1] == ':':
+                segments.append((SEGMENT_LINK, macro_name[1:]))
+            else:
+                segments.append((SEGMENT_ALIAS, macro_name))
+            pos = pos_close + 1
+        if pos < len(in_str):
+            segments.append((SEGMENT_LITERAL, in_str[pos:]))
+        cls._compiled_templates[in_str] = segments
+        return segments
+
     def _expand(self, in_str: str, aliases: Dict[str, str], source_link: Optional[Dict[str, Any]] = None) -> str:
-        """Recursive method to replace strings, placed between "+{" and "}"
+        """Method to replace strings, placed between "+{" and "}". Expanded content is not searched for macros again.
         :param in_str: String to be expanded
         :param aliases: Alias-dictionary
         :param source_link: Reference for :links
@@ -1049,28 +1514,23 @@ class EpicsCfg:
         """
         if not isinstance(in_str, str):
             raise TypeError('Attribute "in_str" of "_expand"-method has to be of type string')
-        pos_open = in_str.find("+{")
-        if pos_open != -1:
-            pos_close = in_str.find("}", pos_open + 1)
-            if pos_close == -1:
-                return in_str
-        else:
-            return in_str
-        try:
-            if pos_close - pos_open == 0:  # Check for empty curly brackets
-                self.logger.write(f'{AsciiFormat.warning}Empty Macro in string "{in_str}" will be ignored!')
-                macro = ''
-            elif in_str[pos_open + 2] == ':':  # Access source data
-                if source_link is None:
-                    raise AttributeError('Tried to expand source-link (+{:link}) without providing source!')
-                macro = str(source_link[in_str[pos_open + 3:pos_close]])
-            else:
-                macro = aliases[in_str[pos_open + 2:pos_close]]
-        except KeyError:
-            self.logger.write(f'{AsciiFormat.warning}Macro {in_str[pos_open:pos_close + 1]} not defined, and will be ignored!')
-            macro = ''
-        out = self._expand(in_str[:pos_open] + macro + in_str[pos_close + 1:], aliases, source_link)
-        return out
+        out = []  # type: List[str]
+        for segment_type, content in self._compile(in_str):
+            if segment_type == SEGMENT_LITERAL:
+                out.append(content)
+                continue
+            try:
+                if segment_type == SEGMENT_LINK:  # Access source data
+                    if source_link is None:
+                        raise AttributeError('Tried to expand source-link (+{:link}) without providing source!')
+                    out.append(str(source_link[content]))
+                else:
+                    out.append(aliases[content])
+            except KeyError:
+                link_mark = ':' if segment_type == SEGMENT_LINK else ''
+                self.logger.write(f'{AsciiFormat.warning}Macro +{{{link_mark}{content}}} not defined, '
+                                  f'and will be ignored!')
+        return ''.join(out)
 
     @staticmethod
     def _process_field_element(xml_address: xmlEleTree.Element) -> Dict[str, str]:
@@ -1088,8 +1548,34 @@ class EpicsCfg:
             raise XmlNodeError(xml_address, '"field"-element misses "value"-attribute!')
         return {field_type: field_value}
 
-    def process_cfg_file(self) -> None:
-        """Process config file and trigger db file creation."""
+    def _scan_field(self, xml_element: xmlEleTree.Element, output_path: str) -> Dict[str, str]:
+        """Resolves the "scan"-attribute of an outputfile-, recordgroup- or record-element to a SCAN field.
+        :param xml_element: Element with optional "scan"-attribute, naming a "scanclass"-element of the config file
+        :param output_path: Path of the output file, for the log
+        :return: Dictionary with the SCAN field, or empty dictionary if the attribute is missing or unknown
+        """
+        scan_class = xml_element.get('scan')
+        if scan_class is None:
+            return {}
+        try:
+            return {'SCAN': self._scan_classes[scan_class]}
+        except KeyError:
+            self.logger.write(f'{AsciiFormat.error}Scan class "{scan_class}" of "{xml_element.tag.split("}")[-1]}"-'
+                              f'element in "outputfile"-element "{output_path}" is not defined! It will be ignored!')
+            return {}
+
+    def process_cfg_file(self,
+                         use_cache: bool = True,
+                         jobs: int = 1,
+                         startup_script: Optional[str] = None,
+                         event_rate: float = 1.0) -> None:
+        """Process config file and trigger db file creation.
+        :param use_cache: If False, all output files are regenerated, regardless of the generation cache.
+        :param jobs: Number of processes, output files are processed in parallel with
+        :param startup_script: Rendered IOC startup script. Its dbLoadRecords() calls determine how often each output
+        file is loaded in the scan load report. Without it, each output file is counted once.
+        :param event_rate: Assumed updates per second of records with SCAN=I/O Intr or Event, for the scan load report
+        """
         try:
             cfg_file_tree = xmlEleTree.parse(self.file_path)
         except FileNotFoundError:
@@ -1101,160 +1587,71 @@ class EpicsCfg:
             return
         cfg_file_root = cfg_file_tree.getroot()
         ns = {'ns': cfg_file_root.tag.split(sep='{')[1].split(sep='}')[0]}
-        # Load sources
         cfg_sourcefiles = cfg_file_root.findall('ns:sourcefile', ns)
+        cfg_scanclasses = cfg_file_root.findall('ns:scanclass', ns)
+        self._scan_classes = {}
+        for scanclass in cfg_scanclasses:
+            if scanclass.get('name') is None or scanclass.get('value') is None:
+                self.logger.write(f'{AsciiFormat.error}"scanclass"-element misses "name"- or "value"-attribute! '
+                                  f'It will be ignored!')
+                continue
+            self._scan_classes[scanclass.get('name')] = scanclass.get('value')
         if not cfg_sourcefiles:
             self.logger.write(f'{AsciiFormat.warning}No sources are defined in {self.file_path}')
-        else:
-            for sourcefile in cfg_sourcefiles:
-                # Check if sourcefile exists
-                if not os.path.isfile(sourcefile.get('path')):
-                    self.logger.write(f'{AsciiFormat.warning}{os.path.abspath(sourcefile.get("path"))} '
-                                      f'does not point to an existing file!')
-                    continue
-                # Parse source file according to type
-                sourcefile_label = sourcefile.get('label')
-                self.logger.write(f'Source {sourcefile_label} is loaded from "{sourcefile.get("path")}".')
-                if sourcefile.get('type') == 'xml-variables':
-                    # parse aliases
-                    self.logger.write('...Processing aliases.')
-                    aliases = {}
-                    for sourcefile_alias in sourcefile.findall('ns:alias', ns):
-                        alias_attributes = sourcefile_alias.attrib
-                        try:
-                            aliases[alias_attributes['handle']] = alias_attributes['surrogate']
-                        except KeyError:
-                            self.logger.write(f'{AsciiFormat.warning}Non-conform alias element: '
-                                              f'Missing "handle" and/or "surrogate" attribute!')
-                            continue
-                    # parse xmlfile
-                    self.logger.write('...Loading source xml file.')
-                    self.load_source(sourcefile.get('path'), sourcefile_label, aliases=aliases)
-                else:
-                    self.logger.write(f'{AsciiFormat.warning}Source file type {sourcefile.get("type")} is unknown. '
-                                      f'Source file {sourcefile.get("path")} labeled '
-                                      f'{sourcefile.get("label")} will be ignored!\n')
-                    continue
-        # Process output files
+        source_hashes = {sourcefile.get('label'): GenerationCache.file_hash(sourcefile.get('path'))
+                         for sourcefile in cfg_sourcefiles if os.path.isfile(str(sourcefile.get('path')))}
+        cache = GenerationCache(self._cache_path, logger=self.logger)
+        if not use_cache:
+            cache.clear()
+        # Find output files, whose inputs changed since the last run
         cfg_outputfiles = cfg_file_root.findall('ns:outputfile', ns)
         if not cfg_outputfiles:
             self.logger.write(f'{AsciiFormat.error}No output files are defined in {self.file_path}')
             sys.exit(1)
+        outdated_outputfiles = []
         for output_file in cfg_outputfiles:
             if output_file.get('path') is None:
                 self.logger.write(f'{AsciiFormat.error}No path is defined for an outputfile. File omitted!')
                 continue
-            self.logger.write('Compiling EPICS database.')
-            database = DbFile(output_file.get('path'), logging=self.logger)
-            file_autosave = str(output_file.get('autosave')).lower in ['true', '1']
-            autosave_list = []
-            doc_list = []
-            file_tier_fields = {}
-            for field in output_file.findall('ns:field', ns):
-                try:
-                    file_tier_fields.update(self._process_field_element(field))
-                except XmlNodeError as inst:
-                    self.logger.write(f'{AsciiFormat.error}{inst.Message} It will be ignored!')
-                    continue
-            for recordgroup in output_file.findall('ns:recordgroup', ns):
-                record_type = recordgroup.get('type')
-                if record_type is None:
-                    self.logger.write(f'{AsciiFormat.error}"recordgroup"-element of "outputfile"-element '
-                                      f'"{output_file.get("path")}" misses "type"-attribute! It will be ignored!')
-                    continue
-                recordgroup_tier_fields = dict(file_tier_fields)  # Copy file tier fields in new dict
-                for field in recordgroup.findall('ns:field', ns):
-                    try:
-                        recordgroup_tier_fields.update(self._process_field_element(field))
-                    except XmlNodeError as inst:
-                        self.logger.write(f'{AsciiFormat.error}{inst.Message} It will be ignored!')
-                        continue
-                if str(recordgroup.get('autosave')).lower() in ['true', '1']:
-                    recordgroup_autosave = True
-                elif str(recordgroup.get('autosave')).lower() in ['false', '0']:
-                    recordgroup_autosave = False
-                else:
-                    recordgroup_autosave = file_autosave
-                for record in recordgroup.findall('ns:record', ns):
-                    # Check mandatory attributes for record element
-                    if record.get('pvName') is None:
-                        self.logger.write(f'{AsciiFormat.error}"record"-element of "outputfile"-element '
-                                          f'"{output_file.get("path")}" misses "pvName"-attribute! It will be ignored!')
-                        continue
-                    if record.get('source') is None:
-                        self.logger.write(f'{AsciiFormat.error}"record"-element of "outputfile"-element '
-                                          f'"{output_file.get("path")}" misses "source"-attribute! It will be ignored!')
-                        continue
-                    # Read field elements of record
-                    record_fields = dict(recordgroup_tier_fields)
-                    for field in record.findall('ns:field', ns):
-                        try:
-                            record_fields.update(self._process_field_element(field))
-                        except XmlNodeError as inst:
-                            self.logger.write(f'{AsciiFormat.error}{inst.Message} It will be ignored!')
-                            continue
-                    # Process source attribute
-                    try:
-                        source_label, source_path = record.get('source').split('.', 1)
-                    except ValueError:
-                        source_label = None
-                        source_path = record.get('source')
-                    if source_label is None:  # No string expansion without defined source
-                        for key in record_fields:
-                            record_fields[key] = self._expand(record_fields[key], {},
-                                                              {'source': record.get('source'), 'pvName': record.get('pvName')})
-                        database.add({
-                            'devicePath': source_path,
-                            'pvName': record.get('pvName'),
-                            'recordType': record_type,
-                            'fields': record_fields
-                        })
-                    else:  # Expanding device path and field values
-                        source_aliases = self._sources[source_label].aliases
-                        device_path = self._expand(source_path, source_aliases)
-                        source_link = self._sources[source_label][device_path]
-                        for key in record_fields:
-                            record_fields[key] = self._expand(record_fields[key], source_aliases, source_link)
-                        database.add({
-                            'devicePath': device_path,
-                            'pvName': record.get('pvName'),
-                            'recordType': record_type,
-                            'fields': record_fields
-                        })
-                        try:  # Remove source entry from list of remaining entries.
-                            self._remaining_source_entries[source_label].remove(device_path)
-                        except ValueError:
-                            self.logger.write(f'{AsciiFormat.warning}No entry for {device_path} in list of remaining entries! '
-                                              f'Either not present in source file or already used.')
-                        doc_list_entry = '/'.join(self._expand("+{:description}", source_aliases, source_link).split(' - ')[-2:])
-                        doc_list.append(f'{record.get("pvName")} ({record_type}): {doc_list_entry}')
-                    if str(record.get('autosave')).lower() in ['true', '1']:
-                        record_autosave = True
-                    elif str(record.get('autosave')).lower() in ['false', '0']:
-                        record_autosave = False
-                    else:
-                        record_autosave = recordgroup_autosave
-                    if record_autosave:  # Add pv name to autosave list
-                        autosave_list.append(record.get('pvName'))
-            # Write db-file
-            self.logger.write(f'Writing file: "{database.file_path}".')
-            database.write_db_file(self.file_path)  # file_path for comment in db-file, not path to db-file itself.
-            # Write autosave .req-file
-            if output_file.get('autosavePath') is None:
-                autosave_path = os.path.abspath(f'{output_file.get("path").rsplit(".", 1)[0]}.req')
+            output_key = self._output_hash(output_file, cfg_sourcefiles, cfg_scanclasses, source_hashes, ns)
+            if cache.output_up_to_date(output_file.get('path'), output_key):
+                self.logger.write(f'Output file "{os.path.abspath(output_file.get("path"))}" is up to date.')
             else:
-                autosave_path = os.path.abspath(output_file.get('autosavePath'))
-            if autosave_list:
-                self.logger.write(f'Writing autosave file: "{autosave_path}".')
-                with open(autosave_path, 'w') as autosave_file:
-                    autosave_file.write('\n'.join(autosave_list) + '\n')
-            # Generate documentation for PVs
-            docfile_path = os.path.abspath(f'{output_file.get("path").rsplit(".", 1)[0]}_descriptions.txt')
-            if doc_list:
-                self.logger.write(f'Writing PV descriptions to file: "{docfile_path}".')
-                doc_list_compiled = '\n'.join(sorted(doc_list))
-                with open(docfile_path, 'w') as docfile:
-                    docfile.write(f'Descriptions for PVs defined in "{self.file_path}"\n\n{doc_list_compiled}')
+                outdated_outputfiles.append((output_file, output_key))
+        with open(self.file_path, 'rb') as cfg_file:
+            report_key = GenerationCache.content_hash(VERSION, cfg_file.read(), *sorted(source_hashes.items()))
+        if not outdated_outputfiles and cache.report_key == report_key:
+            self.logger.write('All output files are up to date.')
+            self._write_unprocessed_report(cache.unprocessed)
+            self._write_load_report(cfg_outputfiles, cache, startup_script, event_rate)
+            return
+        # Load sources
+        self._load_sources(cfg_sourcefiles, ns)
+        # Take over source entries used by output files, which are up to date
+        outdated_paths = [output_file.get('path') for output_file, _ in outdated_outputfiles]
+        for output_file in cfg_outputfiles:
+            if output_file.get('path') is None or output_file.get('path') in outdated_paths:
+                continue
+            for source_label, device_paths in cache.used_entries(output_file.get('path')).items():
+                remaining_entries = self._remaining_source_entries.get(source_label, {})
+                for device_path in device_paths:
+                    remaining_entries.pop(device_path, None)
+        # Process output files
+        if jobs > 1 and len(outdated_outputfiles) > 1:
+            results = self._process_output_files_parallel([output_file for output_file, _ in outdated_outputfiles],
+                                                          ns, jobs)
+        else:
+            results = (self._process_output_file(output_file, ns) for output_file, _ in outdated_outputfiles)
+        for (output_file, output_key), (used_entries, written_files, scan_summary) in zip(outdated_outputfiles,
+                                                                                           results):
+            for source_label, device_paths in used_entries.items():
+                for device_path in device_paths:
+                    try:  # Remove source entry from remaining entries.
+                        del self._remaining_source_entries[source_label][device_path]
+                    except KeyError:
+                        self.logger.write(f'{AsciiFormat.warning}No entry for {device_path} in list of remaining '
+                                          f'entries! Either not present in source file or already used.')
+            cache.update_output(output_file.get('path'), output_key, used_entries, written_files, scan_summary)
         # Process ignore section
         cfg_ignore = cfg_file_root.find('ns:ignore', ns)
         if cfg_ignore:
@@ -1264,18 +1661,298 @@ class EpicsCfg:
                 source_aliases = self._sources[source_label].aliases
                 device_path = self._expand(source_path, source_aliases)
                 try:
-                    self._remaining_source_entries[source_label].remove(device_path)
-                except ValueError:
+                    del self._remaining_source_entries[source_label][device_path]
+                except KeyError:
                     self.logger.write(f'{AsciiFormat.warning}No entry for {device_path} in remaining entries! '
                                       f'Either not present in source file or already used.')
-            cfg_ignore_masks = cfg_ignore.findall('ns:mask', ns)
-            for ignore_mask in cfg_ignore_masks:
-                source_label = ignore_mask.get('sourceLabel')
-                filtered = [entry for entry in self._remaining_source_entries[source_label] if not re.match(ignore_mask.get('regex'), entry)]
-                self._remaining_source_entries[source_label] = filtered
-        # Compile list of unused source entries to log
+            # Combine the masks of each source into as few patterns as possible, so remaining entries are filtered in
+            # one pass. Masks with groups or inline flags are kept separate, as combining them would renumber their
+            # backreferences or move their flags.
+            ignore_masks = {}  # type: Dict[str, List[re.Pattern]]
+            for ignore_mask in cfg_ignore.findall('ns:mask', ns):
+                try:
+                    ignore_masks.setdefault(ignore_mask.get('sourceLabel'), []).append(
+                        re.compile(ignore_mask.get('regex')))
+                except (re.error, TypeError):
+                    self.logger.write(f'{AsciiFormat.error}"mask"-element with invalid "regex"-attribute '
+                                      f'"{ignore_mask.get("regex")}"! It will be ignored!')
+                    continue
+            default_flags = re.compile('').flags
+            for source_label, patterns in ignore_masks.items():
+                if source_label not in self._remaining_source_entries:
+                    self.logger.write(f'{AsciiFormat.warning}"mask"-element refers to unknown source label '
+                                      f'"{source_label}"! It will be ignored!')
+                    continue
+                combinable = [pattern for pattern in patterns if pattern.groups == 0 and pattern.flags == default_flags]
+                ignore_patterns = [pattern for pattern in patterns if pattern not in combinable]
+                if len(combinable) > 1:
+                    try:
+                        combinable = [re.compile('|'.join(f'(?:{pattern.pattern})' for pattern in combinable))]
+                    except re.error:  # Keep the masks separate, if they can not be combined
+                        pass
+                ignore_patterns.extend(combinable)
+                self._remaining_source_entries[source_label] = dict.fromkeys(
+                    entry for entry in self._remaining_source_entries[source_label]
+                    if not any(pattern.match(entry) for pattern in ignore_patterns))
+        cache.update_report(report_key, {source_label: list(entries)
+                                         for source_label, entries in self._remaining_source_entries.items()})
+        cache.save()
+        self._write_unprocessed_report(self._remaining_source_entries)
+        self._write_load_report(cfg_outputfiles, cache, startup_script, event_rate)
+
+    def _load_sources(self, cfg_sourcefiles: List[xmlEleTree.Element], ns: Dict[str, str]):
+        """Loads all source files, defined in config file.
+        :param cfg_sourcefiles: "sourcefile"-elements of the config file
+        :param ns: Namespace of the config file
+        """
+        for sourcefile in cfg_sourcefiles:
+            # Check if sourcefile exists
+            if not os.path.isfile(sourcefile.get('path')):
+                self.logger.write(f'{AsciiFormat.warning}{os.path.abspath(sourcefile.get("path"))} '
+                                  f'does not point to an existing file!')
+                continue
+            # Parse source file according to type
+            sourcefile_label = sourcefile.get('label')
+            self.logger.write(f'Source {sourcefile_label} is loaded from "{sourcefile.get("path")}".')
+            if sourcefile.get('type') == 'xml-variables':
+                # parse aliases
+                self.logger.write('...Processing aliases.')
+                aliases = {}
+                for sourcefile_alias in sourcefile.findall('ns:alias', ns):
+                    alias_attributes = sourcefile_alias.attrib
+                    try:
+                        aliases[alias_attributes['handle']] = alias_attributes['surrogate']
+                    except KeyError:
+                        self.logger.write(f'{AsciiFormat.warning}Non-conform alias element: '
+                                          f'Missing "handle" and/or "surrogate" attribute!')
+                        continue
+                # parse xmlfile
+                self.logger.write('...Loading source xml file.')
+                self.load_source(sourcefile.get('path'), sourcefile_label, aliases=aliases)
+            else:
+                self.logger.write(f'{AsciiFormat.warning}Source file type {sourcefile.get("type")} is unknown. '
+                                  f'Source file {sourcefile.get("path")} labeled '
+                                  f'{sourcefile.get("label")} will be ignored!\n')
+                continue
+
+    def _output_hash(self,
+                     output_file: xmlEleTree.Element,
+                     cfg_sourcefiles: List[xmlEleTree.Element],
+                     cfg_scanclasses: List[xmlEleTree.Element],
+                     source_hashes: Dict[str, str],
+                     ns: Dict[str, str]) -> str:
+        """Hashes everything the content of an output file depends on: the "outputfile"-element, the source files
+        referenced by its records, including their aliases, the scan classes, the path of the config file and the
+        generator version.
+        :param output_file: "outputfile"-element of the config file
+        :param cfg_sourcefiles: "sourcefile"-elements of the config file
+        :param cfg_scanclasses: "scanclass"-elements of the config file
+        :param source_hashes: Content hashes of the source files by label
+        :param ns: Namespace of the config file
+        :return: Hash as hex string
+        """
+        source_labels = set()
+        for record in output_file.iterfind('ns:recordgroup/ns:record', ns):
+            if '.' in str(record.get('source')):
+                source_labels.add(record.get('source').split('.', 1)[0])
+        hash_parts = [VERSION, self.file_path, xmlEleTree.tostring(output_file)]
+        hash_parts.extend(xmlEleTree.tostring(scanclass) for scanclass in cfg_scanclasses)
+        for sourcefile in cfg_sourcefiles:
+            if sourcefile.get('label') in source_labels:
+                hash_parts.append(xmlEleTree.tostring(sourcefile))
+                hash_parts.append(source_hashes.get(sourcefile.get('label'), ''))
+        return GenerationCache.content_hash(*hash_parts)
+
+    def compile_database(self,
+                         output_file: xmlEleTree.Element,
+                         ns: Dict[str, str]) -> Tuple[DbFile, List[str], List[str], Dict[str, List[str]]]:
+        """Compiles the EPICS database, defined by an "outputfile"-element, by expanding the device paths and fields of
+        all its records. Requires the sources and scan classes of the config file, loaded by process_cfg_file().
+        :param output_file: "outputfile"-element of the config file
+        :param ns: Namespace of the config file
+        :return: The database, the PV names to autosave, the PV descriptions and the source entries used by the
+        records, by source label
+        """
+        self.logger.write('Compiling EPICS database.')
+        database = DbFile(output_file.get('path'), logging=self.logger)
+        file_autosave = str(output_file.get('autosave')).lower in ['true', '1']
+        autosave_list = []
+        doc_list = []
+        used_entries = {}  # type: Dict[str, List[str]]
+        file_tier_fields = self._scan_field(output_file, output_file.get('path'))
+        for field in output_file.findall('ns:field', ns):
+            try:
+                file_tier_fields.update(self._process_field_element(field))
+            except XmlNodeError as inst:
+                self.logger.write(f'{AsciiFormat.error}{inst.Message} It will be ignored!')
+                continue
+        for recordgroup in output_file.findall('ns:recordgroup', ns):
+            record_type = recordgroup.get('type')
+            if record_type is None:
+                self.logger.write(f'{AsciiFormat.error}"recordgroup"-element of "outputfile"-element '
+                                  f'"{output_file.get("path")}" misses "type"-attribute! It will be ignored!')
+                continue
+            recordgroup_tier_fields = dict(file_tier_fields)  # Copy file tier fields in new dict
+            recordgroup_tier_fields.update(self._scan_field(recordgroup, output_file.get('path')))
+            for field in recordgroup.findall('ns:field', ns):
+                try:
+                    recordgroup_tier_fields.update(self._process_field_element(field))
+                except XmlNodeError as inst:
+                    self.logger.write(f'{AsciiFormat.error}{inst.Message} It will be ignored!')
+                    continue
+            if str(recordgroup.get('autosave')).lower() in ['true', '1']:
+                recordgroup_autosave = True
+            elif str(recordgroup.get('autosave')).lower() in ['false', '0']:
+                recordgroup_autosave = False
+            else:
+                recordgroup_autosave = file_autosave
+            for record in recordgroup.findall('ns:record', ns):
+                # Check mandatory attributes for record element
+                if record.get('pvName') is None:
+                    self.logger.write(f'{AsciiFormat.error}"record"-element of "outputfile"-element '
+                                      f'"{output_file.get("path")}" misses "pvName"-attribute! It will be ignored!')
+                    continue
+                if record.get('source') is None:
+                    self.logger.write(f'{AsciiFormat.error}"record"-element of "outputfile"-element '
+                                      f'"{output_file.get("path")}" misses "source"-attribute! It will be ignored!')
+                    continue
+                # Read field elements of record
+                record_fields = dict(recordgroup_tier_fields)
+                record_fields.update(self._scan_field(record, output_file.get('path')))
+                for field in record.findall('ns:field', ns):
+                    try:
+                        record_fields.update(self._process_field_element(field))
+                    except XmlNodeError as inst:
+                        self.logger.write(f'{AsciiFormat.error}{inst.Message} It will be ignored!')
+                        continue
+                # Process source attribute
+                try:
+                    source_label, source_path = record.get('source').split('.', 1)
+                except ValueError:
+                    source_label = None
+                    source_path = record.get('source')
+                if source_label is None:  # No string expansion without defined source
+                    for key in record_fields:
+                        record_fields[key] = self._expand(record_fields[key], {},
+                                                          {'source': record.get('source'), 'pvName': record.get('pvName')})
+                    database.add({
+                        'devicePath': source_path,
+                        'pvName': record.get('pvName'),
+                        'recordType': record_type,
+                        'fields': record_fields
+                    })
+                else:  # Expanding device path and field values
+                    source_aliases = self._sources[source_label].aliases
+                    device_path = self._expand(source_path, source_aliases)
+                    source_link = self._sources[source_label][device_path]
+                    for key in record_fields:
+                        record_fields[key] = self._expand(record_fields[key], source_aliases, source_link)
+                    database.add({
+                        'devicePath': device_path,
+                        'pvName': record.get('pvName'),
+                        'recordType': record_type,
+                        'fields': record_fields
+                    })
+                    used_entries.setdefault(source_label, []).append(device_path)
+                    doc_list_entry = '/'.join(self._expand("+{:description}", source_aliases, source_link).split(' - ')[-2:])
+                    doc_list.append(f'{record.get("pvName")} ({record_type}): {doc_list_entry}')
+                if str(record.get('autosave')).lower() in ['true', '1']:
+                    record_autosave = True
+                elif str(record.get('autosave')).lower() in ['false', '0']:
+                    record_autosave = False
+                else:
+                    record_autosave = recordgroup_autosave
+                if record_autosave:  # Add pv name to autosave list
+                    autosave_list.append(record.get('pvName'))
+        return database, autosave_list, doc_list, used_entries
+
+    def _process_output_file(self,
+                             output_file: xmlEleTree.Element,
+                             ns: Dict[str, str]) -> Tuple[Dict[str, List[str]], List[str], Dict[str, Dict[str, int]]]:
+        """Compiles the EPICS database, defined by an "outputfile"-element, and writes db-, req- and description-file.
+        :param output_file: "outputfile"-element of the config file
+        :param ns: Namespace of the config file
+        :return: Source entries used by the records, by source label, paths of the files written and the scan summary
+        of the database
+        """
+        database, autosave_list, doc_list, used_entries = self.compile_database(output_file, ns)
+        # Write db-file
+        self.logger.write(f'Writing file: "{database.file_path}".')
+        database.write_db_file(self.file_path)  # file_path for comment in db-file, not path to db-file itself.
+        written_files = [database.file_path]
+        # Write combined db-files, holding all instances of the database
+        for combined_file in output_file.findall('ns:combinedfile', ns):
+            if combined_file.get('path') is None or combined_file.get('loop') is None:
+                self.logger.write(f'{AsciiFormat.error}"combinedfile"-element of "outputfile"-element '
+                                  f'"{output_file.get("path")}" misses "path"- or "loop"-attribute! '
+                                  f'It will be ignored!')
+                continue
+            combined_macros = {}
+            for macro in combined_file.findall('ns:macro', ns):
+                if macro.get('name') is None or macro.get('value') is None:
+                    self.logger.write(f'{AsciiFormat.error}"macro"-element of "combinedfile"-element '
+                                      f'"{combined_file.get("path")}" misses "name"- or "value"-attribute! '
+                                      f'It will be ignored!')
+                    continue
+                combined_macros[macro.get('name')] = macro.get('value')
+            self.logger.write(f'Writing combined file: "{os.path.abspath(combined_file.get("path"))}".')
+            database.write_combined_db_file(combined_file.get('path'), combined_file.get('loop'), combined_macros,
+                                            self.file_path)
+            written_files.append(os.path.abspath(combined_file.get('path')))
+        # Write autosave .req-file
+        if output_file.get('autosavePath') is None:
+            autosave_path = os.path.abspath(f'{output_file.get("path").rsplit(".", 1)[0]}.req')
+        else:
+            autosave_path = os.path.abspath(output_file.get('autosavePath'))
+        if autosave_list:
+            self.logger.write(f'Writing autosave file: "{autosave_path}".')
+            write_file_atomically(autosave_path, ('\n'.join(autosave_list), '\n'))
+            written_files.append(autosave_path)
+        # Generate documentation for PVs
+        docfile_path = os.path.abspath(f'{output_file.get("path").rsplit(".", 1)[0]}_descriptions.txt')
+        if doc_list:
+            self.logger.write(f'Writing PV descriptions to file: "{docfile_path}".')
+            doc_list_compiled = '\n'.join(sorted(doc_list))
+            write_file_atomically(docfile_path,
+                                  (f'Descriptions for PVs defined in '
+                                   f'"{_relative_source(self.file_path, docfile_path)}"\n\n', doc_list_compiled))
+            written_files.append(docfile_path)
+        return used_entries, written_files, database.scan_summary()
+
+    def _process_output_files_parallel(self,
+                                       output_files: List[xmlEleTree.Element],
+                                       ns: Dict[str, str],
+                                       jobs: int):
+        """Processes output files in a pool of worker processes. Workers only read the loaded sources and return the
+        source entries they used, so the list of remaining entries is updated by the caller.
+        :param output_files: "outputfile"-elements of the config file
+        :param ns: Namespace of the config file
+        :param jobs: Maximum number of worker processes
+        :return: Generator, providing the results of _process_output_file() in the order of output_files
+        """
+        # Forked workers inherit the loaded sources, instead of receiving a pickled copy
+        if 'fork' in multiprocessing.get_all_start_methods():
+            mp_context = multiprocessing.get_context('fork')
+        else:
+            mp_context = None
+        self.logger.write(f'Processing {len(output_files)} output files in up to {jobs} processes.')
+        with ProcessPoolExecutor(max_workers=min(jobs, len(output_files)),
+                                 mp_context=mp_context,
+                                 initializer=_init_output_worker,
+                                 initargs=(self, output_files, ns)) as executor:
+            futures = [executor.submit(_run_output_worker, output_number) for output_number in range(len(output_files))]
+            for future in futures:
+                used_entries, written_files, scan_summary, log_messages = future.result()
+                for log_message in log_messages:
+                    self.logger.write(log_message)
+                yield used_entries, written_files, scan_summary
+
+    def _write_unprocessed_report(self, unprocessed_entries: Mapping[str, Iterable[str]]):
+        """Writes list of unused source entries to log
+        :param unprocessed_entries: Source entries, which were not processed, by source label
+        """
         list_unprocessed = []
-        for label, content in self._remaining_source_entries.items():
+        for label, content in unprocessed_entries.items():
             header = AsciiFormat.colored('Sourcefile label: ', 'green') + AsciiFormat.bold(label)
             address_list = '\n'.join(content)
             list_unprocessed.append(f'\n{header}\n{address_list}')
@@ -1284,28 +1961,178 @@ class EpicsCfg:
                           f'{AsciiFormat.colored("The following entries in the sourcefiles were not processed:", "BoldCyan")}\n'
                           f'{unprocessed}')
 
+    @staticmethod
+    def _scan_rate(scan: str, event_rate: float) -> Optional[float]:
+        """Determines, how often per second a record is processed.
+        :param scan: Value of the SCAN field
+        :param event_rate: Assumed updates per second of records with SCAN=I/O Intr or Event
+        :return: Processings per second, or None if the SCAN value is unknown
+        """
+        if scan == 'Passive':
+            return 0.0
+        if scan in ['I/O Intr', 'Event']:
+            return event_rate
+        periodic_scan = EPICS_PERIODIC_SCAN_PATTERN.match(scan)
+        if periodic_scan is None:
+            return None
+        try:
+            value = float(periodic_scan.group(1))
+        except ValueError:
+            return None
+        if periodic_scan.group(2) == 'Hz':
+            return value
+        return 1.0 / value if value > 0 else None
+
+    def _write_load_report(self,
+                           cfg_outputfiles: List[xmlEleTree.Element],
+                           cache: GenerationCache,
+                           startup_script: Optional[str],
+                           event_rate: float):
+        """Writes the estimated scan load of every output file and of all output files together to log. Passive
+        records are only processed on writes and are listed without load.
+        :param cfg_outputfiles: "outputfile"-elements of the config file
+        :param cache: Generation cache, holding the scan summaries of the output files
+        :param startup_script: Rendered IOC startup script, to count the dbLoadRecords() calls per output file. Rendered
+        combined files, loaded by the script, are counted with the number of instances they hold.
+        :param event_rate: Assumed updates per second of records with SCAN=I/O Intr or Event
+        """
+        loaded_files = None  # type: Optional[Counter]
+        if startup_script is not None:
+            try:
+                with open(startup_script, 'r', encoding='utf-8') as script_file:
+                    loaded_files = Counter(EPICS_DBLOADRECORDS_PATTERN.findall(script_file.read()))
+            except OSError:
+                self.logger.write(f'{AsciiFormat.warning}Startup script "{startup_script}" can not be read! '
+                                  f'Every output file is counted once.')
+        header = f'    {"SCAN":<16}{"records":>10}{"elements/s":>14}{"bytes/s":>14}'
+        total = {}  # type: Dict[str, List[float]]
+        report = []
+        for output_file in cfg_outputfiles:
+            if output_file.get('path') is None:
+                continue
+            scan_summary = cache.scan_summary(output_file.get('path'))
+            if loaded_files is None:
+                instances = 1
+            else:
+                instances = sum(count for db_path, count in loaded_files.items()
+                                if os.path.basename(db_path) == os.path.basename(output_file.get('path')))
+                records_per_instance = sum(scan_entry['records'] for scan_entry in scan_summary.values())
+                combined_names = [os.path.basename(str(combined_file.get('path')))
+                                  for combined_file in output_file.iter() if combined_file.tag.endswith('combinedfile')]
+                for db_path, count in loaded_files.items():
+                    if os.path.basename(db_path) not in combined_names or records_per_instance == 0:
+                        continue
+                    # Paths in the script are relative to the IOC directory, which holds the script
+                    rendered_path = os.path.join(os.path.dirname(os.path.abspath(startup_script)), db_path)
+                    try:
+                        with open(rendered_path, 'r', encoding='utf-8') as db_file:
+                            records = sum(1 for line in db_file if line.startswith('record('))
+                    except OSError:
+                        self.logger.write(f'{AsciiFormat.warning}Rendered combined file "{rendered_path}" can not be '
+                                          f'read! It is not included in the scan load report.')
+                        continue
+                    instances += count * (records // records_per_instance)
+            lines = [f'\n{AsciiFormat.bold(os.path.abspath(output_file.get("path")))} (loaded {instances}x)', header]
+            for scan, scan_entry in sorted(scan_summary.items()):
+                rate = self._scan_rate(scan, event_rate)
+                if rate is None:
+                    self.logger.write(f'{AsciiFormat.warning}Unknown SCAN value "{scan}" is not included in the scan '
+                                      f'load report.')
+                    rate = 0.0
+                load = [scan_entry['records'],
+                        scan_entry['elements'] * rate,
+                        scan_entry['bytes'] * rate]
+                lines.append(f'    {scan:<16}{load[0]:>10}{load[1]:>14.1f}{load[2]:>14.1f}')
+                total_entry = total.setdefault(scan, [0, 0.0, 0.0])
+                for position, value in enumerate(load):
+                    total_entry[position] += instances * value
+            report.append('\n'.join(lines))
+        total_lines = [f'\n{AsciiFormat.bold("Total")}', header]
+        for scan, load in sorted(total.items()):
+            total_lines.append(f'    {scan:<16}{load[0]:>10}{load[1]:>14.1f}{load[2]:>14.1f}')
+        total_lines.append(f'    {"all":<16}{sum(load[0] for load in total.values()):>10}'
+                           f'{sum(load[1] for load in total.values()):>14.1f}'
+                           f'{sum(load[2] for load in total.values()):>14.1f}')
+        report.append('\n'.join(total_lines))
+        title = (f'Estimated scan load (I/O Intr records at {event_rate:g} updates/s, '
+                 f'one Channel Access monitor per PV):')
+        self.logger.write(f'{AsciiFormat.colored(title, "BoldCyan")}\n' + '\n'.join(report))
+
+
+# State of output worker processes, set by _init_output_worker()
+_output_worker_state = {}  # type: Dict[str, Any]
+
+
+def _init_output_worker(cfg: EpicsCfg, output_files: List[xmlEleTree.Element], ns: Dict[str, str]):
+    """Initializer of worker processes, started by EpicsCfg._process_output_files_parallel().
+    :param cfg: Config object with loaded sources
+    :param output_files: "outputfile"-elements to be processed
+    :param ns: Namespace of the config file
+    """
+    _output_worker_state.update(cfg=cfg, output_files=output_files, ns=ns)
+
 
-CLAP = argparse.ArgumentParser(
-    description='Generates EPICS PV database for every \'PV\' defined in ChimeraTK-xml file to EPICS database file.')
-CLAP.add_argument('config_file',
-                  help='Path to configuration file. Defaults to "mapConfig.xml"')
-CLAP.add_argument('-l',
-                  help='Define path to logfile. Defaults to dbGen.log in CWD.',
-                  metavar='logfile',
-                  default='dbGen.log')
-CLAP.add_argument('-g',
-                  help='Generates config file from xml-variables file, specified in "path".',
-                  metavar='variable_file')
-# Parse Command Line Arguments
-CLA = CLAP.parse_args()
-
-# initiate logging
-log = Logging(CLA.l)
-
-if CLA.g is not None:  # generate config file
-    config = EpicsCfg(os.path.abspath(CLA.config_file), logger=log)
-    config.load_source(CLA.g, 'xmlLabel')
-    config.generate_config_file('xmlLabel')
-else:  # Load config file
-    config = EpicsCfg(os.path.abspath(CLA.config_file), logger=log)
-    config.process_cfg_file()
+def _run_output_worker(output_number: int) -> Tuple[Dict[str, List[str]], List[str], Dict[str, Dict[str, int]],
+                                                    List[str]]:
+    """Processes a single output file in a worker process.
+    :param output_number: Position of the "outputfile"-element in the list passed to _init_output_worker()
+    :return: Used source entries, paths of the written files, scan summary and the log messages of the worker
+    """
+    cfg = _output_worker_state['cfg']  # type: EpicsCfg
+    log_buffer = LogBuffer()
+    cfg.logger = log_buffer
+    for source in cfg._sources.values():
+        source.logger = log_buffer
+    used_entries, written_files, scan_summary = cfg._process_output_file(
+        _output_worker_state['output_files'][output_number], _output_worker_state['ns'])
+    return used_entries, written_files, scan_summary, log_buffer.messages
+
+
+if __name__ == '__main__':
+    CLAP = argparse.ArgumentParser(
+        description='Generates EPICS PV database for every \'PV\' defined in ChimeraTK-xml file to EPICS database file.')
+    CLAP.add_argument('config_file',
+                      help='Path to configuration file. Defaults to "mapConfig.xml"')
+    CLAP.add_argument('-l',
+                      help='Define path to logfile. Defaults to dbGen.log in CWD.',
+                      metavar='logfile',
+                      default='dbGen.log')
+    CLAP.add_argument('-g',
+                      help='Generates config file from xml-variables file, specified in "path".',
+                      metavar='variable_file')
+    CLAP.add_argument('-i',
+                      help='Use SCAN=I/O Intr for input records in a config file generated with -g, instead of polling '
+                           'them once per second.',
+                      action='store_true')
+    CLAP.add_argument('-f',
+                      help='Force generation of all output files, even if their inputs did not change.',
+                      action='store_true')
+    CLAP.add_argument('-j',
+                      help='Number of processes to generate output files in parallel. Defaults to 1.',
+                      metavar='jobs',
+                      type=int,
+                      default=1)
+    CLAP.add_argument('-s',
+                      help='Rendered IOC startup script. The scan load report counts each output file as often as it '
+                           'is loaded by dbLoadRecords() in the script, i.e. once per motor, and rendered combined '
+                           'files with the number of instances they hold.',
+                      metavar='startup_script')
+    CLAP.add_argument('-e',
+                      help='Updates per second assumed for records with SCAN=I/O Intr in the scan load report. '
+                           'Defaults to 1.',
+                      metavar='event_rate',
+                      type=float,
+                      default=1.0)
+    # Parse Command Line Arguments
+    CLA = CLAP.parse_args()
+
+    # initiate logging
+    log = Logging(CLA.l)
+
+    if CLA.g is not None:  # generate config file
+        config = EpicsCfg(os.path.abspath(CLA.config_file), logger=log)
+        config.load_source(CLA.g, 'xmlLabel')
+        config.generate_config_file('xmlLabel', io_intr=CLA.i)
+    else:  # Load config file
+        config = EpicsCfg(os.path.abspath(CLA.config_file), logger=log)
+        config.process_cfg_file(use_cache=not CLA.f, jobs=CLA.j, startup_script=CLA.s, event_rate=CLA.e)
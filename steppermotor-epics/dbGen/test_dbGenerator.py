@@ -0,0 +1,49 @@
+#!/usr/bin/python3
+
+"""@package docstring
+Regression tests for dbGenerator.py. Run from this directory with "python3 -m unittest" or pytest.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+DBGEN_DIR = os.path.dirname(os.path.abspath(__file__))
+TESTDATA_DIR = os.path.join(DBGEN_DIR, 'testdata')
+# Placeholder for the directory of the generated files, which dbGenerator.py writes as absolute paths
+TESTDIR_PLACEHOLDER = b'@TESTDIR@'
+
+
+class ConfigGenerationTest(unittest.TestCase):
+    """Generates config files with "dbGenerator.py -g" and compares them byte by byte with the golden files in
+    testdata/. If a change of the output is intended, the golden file has to be regenerated and the paths replaced by
+    the placeholder."""
+
+    def setUp(self):
+        self.test_dir = os.path.realpath(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def generate_config_file(self, variable_file: str) -> bytes:
+        """Runs dbGenerator.py in the test directory, with a copy of the variable file.
+        :param variable_file: Name of the xml-variables file in this directory
+        :return: Content of the generated config file
+        """
+        shutil.copy(os.path.join(DBGEN_DIR, variable_file), self.test_dir)
+        subprocess.run([sys.executable, os.path.join(DBGEN_DIR, 'dbGenerator.py'), 'cfg.xml', '-g', variable_file],
+                       cwd=self.test_dir, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, check=True)
+        with open(os.path.join(self.test_dir, 'cfg.xml'), 'rb') as cfg_file:
+            return cfg_file.read()
+
+    def test_steppermotorserver_1_0_4(self):
+        with open(os.path.join(TESTDATA_DIR, 'steppermotorserver_1_0_4-cfg.xml'), 'rb') as golden_file:
+            golden = golden_file.read().replace(TESTDIR_PLACEHOLDER, os.fsencode(self.test_dir))
+        self.assertEqual(self.generate_config_file('steppermotorserver_1_0_4.xml'), golden)
+
+
+if __name__ == '__main__':
+    unittest.main()
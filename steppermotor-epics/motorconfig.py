@@ -0,0 +1 @@
+../steppermotor/motorconfig.py
\ No newline at end of file
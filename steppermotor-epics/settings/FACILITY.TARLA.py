@@ -22,7 +22,7 @@ if ACCELERATOR == 'TARLA':
     if STATION == 'MOTORDRV':
         #TODO clean up MOTORDRIVER_CFG_FILE variable
         MOTORDRIVER_CFG_FILE='Limes122-MotorDriverCardConfig-Tarla.xml'
-        motor_cfg = MotorConfig()
+        motor_cfg = MotorConfig(MAPP_REGISTRY)
         motor_cfg.add_device('MotorDriver1', 'FMC25_70t', 3, 'llrf_resonance_ctrl', '1.3.0-0-g154a8033')
         motor_cfg.add_device('MotorDriver2', 'FMC25_70t', 4, 'llrf_resonance_ctrl', '1.3.0-0-g154a8033')
         motor_cfg.add_motor('B1', 'LinearMotorWithReferenceSwitch', 'MotorDriver1', 'FMC2', 0, MOTORDRIVER_CFG_FILE)
@@ -21,6 +21,6 @@ if ACCELERATOR == 'TEST':
     if STATION == 'SCAV2':
         #TODO clean up MOTORDRIVER_CFG_FILE variable
         MOTORDRIVER_CFG_FILE='Limes122-MotorDriverCardConfig.xml'
-        motor_cfg = MotorConfig()
+        motor_cfg = MotorConfig(MAPP_REGISTRY)
         motor_cfg.add_device('MotorDriver1', 'FMC25_70t', 4, 'llrf_resonance_ctrl', '1.1.0-9-g193bac26')
         motor_cfg.add_motor('Test1', 'LinearMotorWithReferenceSwitch', 'MotorDriver1', 'FMC2', 0, MOTORDRIVER_CFG_FILE)
@@ -0,0 +1,573 @@
+"""Data model of the stepper motor configuration, shared by the DOOCS and EPICS flavours. Imported by baseconfig.py,
+which is executed by ConfigGenerator for every host, so the classes are only defined once per run.
+"""
+
+import csv
+import os
+import sys
+
+
+# Parameters of MotorConfig.add_device() and MotorConfig.add_motor(), i.e. the columns of device and motor tables
+DEVICE_COLUMNS = ('device_name', 'carrier_type', 'slot', 'mapp_base', 'mapp_version')
+MOTOR_COLUMNS = ('motor_name', 'motor_type', 'device', 'fmc_slot', 'port_number', 'config_file', 'fmc_type',
+                 'motor_steps_ratio', 'encoder_steps_ratio', 'position_unit', 'is_dummy')
+REQUIRED_MOTOR_COLUMNS = MOTOR_COLUMNS[:6]
+
+
+def _to_bool(value) -> bool:
+    """Converts table cells like 'true', 'yes' or '1' to bool."""
+    if isinstance(value, bool):
+        return value
+    if str(value).strip().lower() in ['1', 'true', 'yes']:
+        return True
+    if str(value).strip().lower() in ['', '0', 'false', 'no']:
+        return False
+    raise ValueError(f'{value!r} is not a boolean')
+
+
+# Conversion of table cells, which are read as strings from CSV files
+COLUMN_TYPES = {'slot': int,
+                'port_number': int,
+                'motor_steps_ratio': float,
+                'encoder_steps_ratio': float,
+                'is_dummy': _to_bool}
+
+
+def _table_entry(entry, columns: tuple, required: tuple, label: str) -> tuple:
+    """Converts an entry of a device or motor table into keyword arguments of add_device()/add_motor().
+    :param entry: Mapping of column names to values, or sequence of values in the order of columns
+    :param columns: Known columns
+    :param required: Columns without default value
+    :param label: Name of the entry in error messages
+    :return: Tuple of keyword arguments and list of errors
+    """
+    if isinstance(entry, dict):
+        # Empty cells of CSV files fall back to the defaults
+        kwargs = {key: value for key, value in entry.items() if value is not None and value != ''}
+    else:
+        if len(entry) > len(columns):
+            return {}, [f'{label}: Too many values, expected at most {len(columns)}.']
+        kwargs = dict(zip(columns, entry))
+    errors = [f'{label}: Unknown column "{key}".' for key in kwargs if key not in columns]
+    errors += [f'{label}: Missing value for "{key}".' for key in required if key not in kwargs]
+    for key, convert in COLUMN_TYPES.items():
+        if key in kwargs and key in columns:
+            try:
+                kwargs[key] = convert(kwargs[key])
+            except (ValueError, TypeError):  # TypeError for lists or tables of TOML files
+                errors.append(f'{label}: Invalid value {kwargs[key]!r} for "{key}".')
+    return kwargs, errors
+
+
+def _read_table(file_path: str, section: str) -> list:
+    """Reads a device or motor table from a CSV or TOML file.
+    :param file_path: Path to the file. CSV files hold a single table with a header line, TOML files an array of
+     tables per section, i.e. [[device]] and [[motor]].
+    :param section: Name of the array of tables in TOML files
+    :return: List of entries, one dictionary per row
+    """
+    if os.path.splitext(file_path)[1].lower() == '.toml':
+        try:
+            import tomllib
+        except ImportError:
+            raise ImportError('Reading TOML files requires Python 3.11 or newer. Use a CSV file instead.') from None
+        with open(file_path, 'rb') as toml_file:
+            return tomllib.load(toml_file).get(section, [])
+    with open(file_path, newline='', encoding='utf-8') as csv_file:
+        # Missing cells at the end of a row are read as None, and reported as missing values by _table_entry()
+        return [{key.strip(): '' if value is None else value.strip() for key, value in row.items() if key is not None}
+                for row in csv.DictReader(csv_file)]
+
+
+class MappFile:
+    """Register map of a single mapp-file. The file is only read, when its revision or registers are accessed."""
+    __slots__ = ('name', 'path', '_revision', '_registers', '_modules')
+
+    def __init__(self, path: str):
+        """
+        :param path: Path to the mapp-file
+        """
+        self.name = os.path.basename(path)
+        self.path = path
+        self._revision = None
+        self._registers = None
+        self._modules = None
+
+    def _parse(self) -> None:
+        """Reads revision, registers and modules of the file. Modules are all dot-separated prefixes of the register
+        names, i.e. 'MD22', 'MD22.0' for 'MD22.0.WORD_RESET_N'.
+        """
+        registers = set()
+        modules = set()
+        with open(self.path, encoding='utf-8') as mapp_file:
+            for line in mapp_file:
+                words = line.split()
+                if not words or words[0].startswith('#'):  # Empty line, comment or '##mako'
+                    continue
+                if words[0] == '@MAPFILE_REVISION':
+                    self._revision = words[1] if len(words) > 1 else ''
+                    continue
+                if words[0].startswith('@'):
+                    continue
+                registers.add(words[0])
+                segments = words[0].split('.')
+                for length in range(1, len(segments)):
+                    modules.add('.'.join(segments[:length]))
+        self._registers = frozenset(registers)
+        self._modules = frozenset(modules)
+
+    @property
+    def revision(self) -> str:
+        """Revision given by @MAPFILE_REVISION, or None if the file has none."""
+        if self._registers is None:
+            self._parse()
+        return self._revision
+
+    @property
+    def registers(self) -> frozenset:
+        if self._registers is None:
+            self._parse()
+        return self._registers
+
+    @property
+    def modules(self) -> frozenset:
+        if self._modules is None:
+            self._parse()
+        return self._modules
+
+    def has_register(self, register: str) -> bool:
+        return register in self.registers
+
+    def has_module(self, module: str) -> bool:
+        return module in self.modules
+
+
+class MappRegistry:
+    """Index of the mapp-files in a directory, by name and revision. Files are parsed on first use and cached, so
+    devices sharing a mapp-file only read it once.
+    """
+    _registries = {}  # Registry by directory and strictness, shared by all hosts rendered in the same process
+
+    def __init__(self, directory: str, strict: bool = False):
+        """
+        :param directory: Directory holding the mapp-files, i.e. templates/mapp
+        :param strict: If true, validation problems raise a ValueError, otherwise they are printed as warning.
+        """
+        self.directory = directory
+        self.strict = strict
+        try:
+            file_names = sorted(name for name in os.listdir(directory) if name.endswith('.mapp'))
+        except OSError:
+            file_names = []
+        self._files = {name: MappFile(os.path.join(directory, name)) for name in file_names}
+        self._revisions = None
+
+    @classmethod
+    def for_directory(cls, directory: str, strict: bool = False) -> 'MappRegistry':
+        """Provides the registry of a directory, creating it on first use. Strict and non-strict registries are cached
+        separately, so a caller never changes the validation of the others.
+        :param directory: Directory holding the mapp-files
+        :param strict: If true, validation problems raise a ValueError, otherwise they are printed as warning.
+        :return: The registry
+        """
+        key = (os.path.abspath(directory), strict)
+        if key not in cls._registries:
+            cls._registries[key] = cls(*key)
+        return cls._registries[key]
+
+    def __contains__(self, file_name: str) -> bool:
+        return file_name in self._files
+
+    def get(self, file_name: str) -> MappFile:
+        """Look up a mapp-file by name.
+        :param file_name: Name of the file, i.e. FmcCarrier.mapp_file
+        :return: The mapp-file, or None if the directory does not contain it
+        """
+        return self._files.get(file_name)
+
+    def by_revision(self, revision: str) -> list:
+        """List the mapp-files with a given revision. Parses all files on first call.
+        :param revision: Revision as given by @MAPFILE_REVISION, i.e. '1.3.0-0-g154a8033' or '2261'
+        :return: List of mapp-files, ordered by name
+        """
+        if self._revisions is None:
+            self._revisions = {}
+            for mapp_file in self._files.values():
+                self._revisions.setdefault(mapp_file.revision, []).append(mapp_file)
+        return list(self._revisions.get(revision, []))
+
+    def device_problems(self, device: 'FmcCarrier') -> list:
+        """Checks, that the mapp-file of a device exists and holds the reset register of its board.
+        :param device: The device
+        :return: List of problems, empty if the device matches its mapp-file
+        """
+        mapp_file = self.get(device.mapp_file)
+        if mapp_file is None:
+            return [f'Device "{device.name}": mapp-file {device.mapp_file} not found in {self.directory}.']
+        if not mapp_file.has_register(f'{device.board}.WORD_RESET_N'):
+            return [f'Device "{device.name}": Register {device.board}.WORD_RESET_N not found in {device.mapp_file}.']
+        return []
+
+    def motor_problems(self, motor_name: str, device: 'FmcCarrier', fmc_slot: str) -> list:
+        """Checks, that the mapp-file of the device holds the module of a motor's FMC slot.
+        :param motor_name: Name of the motor
+        :param device: The device, the motor is connected to
+        :param fmc_slot: FMC slot, the motor is connected to
+        :return: List of problems, empty if the module exists or the mapp-file is unknown
+        """
+        mapp_file = self.get(device.mapp_file)
+        if mapp_file is not None and not mapp_file.has_module(fmc_slot):
+            return [f'Motor "{motor_name}": Module {fmc_slot} not found in {mapp_file.name} of device '
+                    f'"{device.name}".']
+        return []
+
+
+class FmcCarrier:
+    """Container class to hold the information to compile entries for motor driver devices in the .dmap-file."""
+    __slots__ = ('name', 'type', 'slot', 'board', 'mapp_file')
+
+    def __init__(self, device_name: str, carrier_type: str, slot: int, mapp_base: str, mapp_version: str):
+        """Init-function of FmcCarrier class
+        :param device_name: Name of the device, used to refer to device in init-script and config files
+        :param carrier_type: Type of FMC-carrier card. Used to compile filename of mapp-file. I.e.: 'FMC25'
+        :param slot: Slot in crate, where FMC-carrier is mounted. Used to compile device file name.
+        :param mapp_base: First segment of mapp-file name, without trailing underscore. I.e.: 'llrf_resonance_control'
+        :param mapp_version: Version number of the mapp-file, without leading underscore. I.e.: '1.0.0-0-g1fd3b2b2'
+        """
+        self.name = device_name
+        self.type = carrier_type.lower()
+        self.slot = slot
+        # Hack to distinguish old firmware from new one
+        self.board = 'BOARD.0' if mapp_base.split('_')[0] == 'controller' else 'BSP'
+        self.mapp_file = f'{mapp_base}_{self.type}_{mapp_version}.mapp'
+
+class Motor:
+    """Container class to hold the information necessary to configure a single motor"""
+    __slots__ = ('name', 'type', 'device', 'fmc_slot', 'port', 'config_file', 'fmc_type', 'steps_ratio', 'unit',
+                 'dummy')
+
+    def __init__(self,
+                 motor_name: str,
+                 motor_type: str,
+                 device: FmcCarrier,
+                 fmc_slot: str,
+                 port_number: int,
+                 config_file: str,
+                 fmc_type: str,
+                 motor_steps_ratio: float,
+                 encoder_steps_ratio: float,
+                 position_unit: str,
+                 is_dummy: bool):
+        """Init-function of class Motor
+        :param motor_name: Name to be used in PV to address the motor.
+        :param motor_type: i.e.: 'LinearMotorWithReferenceSwitch'
+        :param device: The FMC-carrier, the motor is connected to.
+        :param fmc_slot: Name used in the firmware to address the FMCs. In newer fw 'FMC1/2' in older fw 'MD22.0/1'.
+        :param port_number: Number of the port on the FMC, the motor is connected to: 0: left/bottom, 1: right/top
+        :param config_file: Path to MD22-configuration file.
+        :param fmc_type: Type of FMC. Usually 'MD22'
+        :param motor_steps_ratio: Conversion factor from steps to unit for the motor.
+        :param encoder_steps_ratio: Conversion factor from steps to unit for the encoder.
+        :param position_unit: Unit to convert steps to.
+        :param is_dummy: If true, a dummy instance is created in the server, instead of reading from the firmware.
+        """
+        self.name = motor_name
+        self.type = motor_type
+        self.device = device
+        self.fmc_slot = fmc_slot
+        self.port = port_number
+        self.config_file = config_file
+        self.fmc_type = fmc_type
+        self.steps_ratio = (motor_steps_ratio, encoder_steps_ratio)  # (motor, encoder)
+        self.unit = position_unit
+        self.dummy = is_dummy
+
+    def is_dummy(self) -> str:
+        """Converts Bool to strings '1'/'0' for use in config-file."""
+        return '1' if self.dummy else '0'
+
+class MotorConfig:
+    """Configuration database class."""
+
+    def __init__(self, mapp_registry: MappRegistry = None):
+        """Init-function of MotorConfig class
+        :param mapp_registry: Mapp-files to validate devices and motors against. baseconfig.py provides it as
+         MAPP_REGISTRY. No validation, if None.
+        """
+        self.mapp_registry = mapp_registry
+        self._devices = {}
+        self._number_devices = 0
+        self._motors = {}
+        self._number_motors = 0
+        # Indexes to check uniqueness and look up motors without iterating over all motors
+        self._motor_names = {}  # Motor by name
+        self._motor_ports = {}  # Motor by (device name, FMC slot, port number)
+        self._device_motors = {}  # Motors by device name
+
+    # The following property-functions prevent direct access to the class members, enforcing the use of
+    # add_device() and add_motor() to add entries.
+    @property
+    def devices(self) -> dict:
+        return self._devices
+
+    @property
+    def motors(self) -> dict:
+        return self._motors
+
+    @property
+    def number_devices(self) -> int:
+        return self._number_devices
+
+    @property
+    def number_motors(self) -> int:
+        return self._number_motors
+
+    def add_device(self, device_name: str, carrier_type: str, slot: int, mapp_base: str, mapp_version: str) -> None:
+        """Add a device to the database. Is required before it can be referenced in add_motor(). If mapp_registry is
+        set, the mapp-file has to exist and hold the reset register of the board.
+        :param device_name: Name of the device, used to refer to device in init-script and config files
+        :param carrier_type: Type of FMC-carrier card. Used to compile filename of mapp-file. I.e.: 'FMC25'
+        :param slot: Slot in crate, where FMC-carrier is mounted. Used to compile device file name.
+        :param mapp_base: First segment of mapp-file name, without trailing underscore. I.e.: 'llrf_resonance_control'
+        :param mapp_version: Version number of the mapp-file, without leading underscore. I.e.: '1.0.0-0-g1fd3b2b2'
+        """
+        device = FmcCarrier(device_name, carrier_type, slot, mapp_base, mapp_version)
+        errors = self._device_errors(device)
+        if errors:
+            raise ValueError(errors[0])
+        self._insert_device(device)
+
+    def _insert_device(self, device: FmcCarrier) -> None:
+        """Adds a validated device to the database."""
+        self._devices[device.name] = device
+        self._device_motors[device.name] = []
+        self._number_devices += 1
+
+    def _device_errors(self, device: FmcCarrier, batch_names: set = None) -> list:
+        """Checks, if a device can be added to the database. Problems found against mapp_registry are errors, if the
+        registry is strict, and are printed as warnings otherwise.
+        :param device: The device
+        :param batch_names: Names of devices, which are about to be added along with this one
+        :return: List of errors, empty if the device can be added
+        """
+        errors = []
+        if device.name in self.devices or (batch_names is not None and device.name in batch_names):
+            errors.append(f'Device "{device.name}" already exists. Device names have to be unique.')
+        if self.mapp_registry is not None:
+            errors += self._mapp_errors(self.mapp_registry.device_problems(device))
+        return errors
+
+    def _mapp_errors(self, problems: list) -> list:
+        """Turns problems found against mapp_registry into errors, if the registry is strict, or prints them as
+        warnings.
+        :param problems: Problems found by mapp_registry
+        :return: List of errors
+        """
+        if self.mapp_registry.strict:
+            return problems
+        for problem in problems:
+            sys.stderr.write(f'Warning: {problem}\n')
+        return []
+
+    def add_motor(self,
+                  motor_name: str,
+                  motor_type: str,
+                  device: str,
+                  fmc_slot: str,
+                  port_number: int,
+                  config_file: str,
+                  fmc_type: str = 'MD22',
+                  motor_steps_ratio: float = 1.0,
+                  encoder_steps_ratio: float = 1.0,
+                  position_unit: str = 'steps',
+                  is_dummy: bool = False) -> None:
+        """Add motor instance to the configuration database. If mapp_registry is set, the mapp-file of the device has to
+        hold the module fmc_slot.
+        :param motor_name: Name to be used in PV to address the motor. Needs to be unique.
+        :param motor_type: i.e.: 'LinearMotorWithReferenceSwitch'
+        :param device: The FMC-carrier, the motor is connected to. Has to be added by add_device(), before.
+        :param fmc_slot: Name used in the firmware to address the FMCs. In newer fw 'FMC1/2' in older fw 'MD22.0/1'.
+        :param port_number: Number of the port on the FMC, the motor is connected to: 0: left/bottom, 1: right/top
+        :param config_file: Path to MD22-configuration file.
+        :param fmc_type: Type of FMC. Defaults to 'MD22'
+        :param motor_steps_ratio: Conversion factor from steps to unit for the motor. Defaults to 1.0
+        :param encoder_steps_ratio: Conversion factor from steps to unit for the encoder. Defaults to 1.0
+        :param position_unit: Unit to convert steps to. Defaults to 'steps'
+        :param is_dummy: If true, a dummy instance is created in the server, instead of reading from the firmware.
+         Defaults to True
+        """
+        errors = self._motor_errors(motor_name, device, fmc_slot, port_number)
+        if errors:
+            raise ValueError(errors[0])
+        self._insert_motor(motor_name, motor_type, device, fmc_slot, port_number, config_file, fmc_type,
+                           motor_steps_ratio, encoder_steps_ratio, position_unit, is_dummy)
+
+    def _insert_motor(self,
+                      motor_name: str,
+                      motor_type: str,
+                      device: str,
+                      fmc_slot: str,
+                      port_number: int,
+                      config_file: str,
+                      fmc_type: str = 'MD22',
+                      motor_steps_ratio: float = 1.0,
+                      encoder_steps_ratio: float = 1.0,
+                      position_unit: str = 'steps',
+                      is_dummy: bool = False) -> None:
+        """Adds a validated motor to the database. Takes the parameters of add_motor()."""
+        port_key = (device, fmc_slot, port_number)
+        motor = Motor(motor_name,
+                      motor_type,
+                      self.devices[device],
+                      fmc_slot,
+                      port_number,
+                      config_file,
+                      fmc_type,
+                      motor_steps_ratio,
+                      encoder_steps_ratio,
+                      position_unit,
+                      is_dummy)
+        self._motors[self.number_motors] = motor
+        self._motor_names[motor_name] = motor
+        self._motor_ports[port_key] = motor
+        self._device_motors[device].append(motor)
+        self._number_motors += 1
+
+    def _motor_errors(self,
+                      motor_name: str,
+                      device: str,
+                      fmc_slot: str,
+                      port_number: int,
+                      batch_names: set = None,
+                      batch_ports: dict = None) -> list:
+        """Checks, if a motor can be added to the database. Problems found against mapp_registry are errors, if the
+        registry is strict, and are printed as warnings otherwise.
+        :param motor_name: Name of the motor
+        :param device: Name of the device, the motor is connected to
+        :param fmc_slot: FMC slot, the motor is connected to
+        :param port_number: Port number, the motor is connected to
+        :param batch_names: Names of motors, which are about to be added along with this one
+        :param batch_ports: Names of motors, which are about to be added along with this one, by port
+        :return: List of errors, empty if the motor can be added
+        """
+        errors = []
+        if device not in self.devices:
+            errors.append(f'Unknown device: {device}\nKnown devices: {self.devices.keys()}')
+        if port_number not in [0, 1]:
+            errors.append(f'{port_number} is not a valid port number. Port numbers should be either 0 or 1')
+        if motor_name in self._motor_names or (batch_names is not None and motor_name in batch_names):
+            errors.append(f'The motor name "{motor_name}" is not unique!')
+        port_key = (device, fmc_slot, port_number)
+        if port_key in self._motor_ports:
+            errors.append(f'Port {port_number} of {fmc_slot} on device "{device}" is already used by motor '
+                          f'"{self._motor_ports[port_key].name}"!')
+        elif batch_ports is not None and port_key in batch_ports:
+            errors.append(f'Port {port_number} of {fmc_slot} on device "{device}" is already used by motor '
+                          f'"{batch_ports[port_key]}"!')
+        if self.mapp_registry is not None and device in self.devices:
+            errors += self._mapp_errors(self.mapp_registry.motor_problems(motor_name, self.devices[device], fmc_slot))
+        return errors
+
+    def add_devices_bulk(self, devices) -> None:
+        """Add several devices to the database. All entries are validated first, and either all or none are added.
+        :param devices: Iterable of devices, each a dictionary with the parameters of add_device() or a sequence of
+         them in the same order
+        :raises ValueError: Listing all invalid entries
+        """
+        entries = []
+        errors = []
+        names = set()
+        for number, device in enumerate(devices, start=1):
+            kwargs, entry_errors = _table_entry(device, DEVICE_COLUMNS, DEVICE_COLUMNS, f'Device {number}')
+            if not entry_errors:
+                entry = FmcCarrier(**kwargs)
+                entry_errors += [f'Device {number}: {error}' for error in self._device_errors(entry, names)]
+                names.add(entry.name)
+                entries.append(entry)
+            errors += entry_errors
+        if errors:
+            raise ValueError(f'{len(errors)} error(s) in device table:\n' + '\n'.join(errors))
+        for entry in entries:
+            self._insert_device(entry)
+
+    def add_motors_bulk(self, motors) -> None:
+        """Add several motors to the database. All entries are validated first, and either all or none are added.
+        :param motors: Iterable of motors, each a dictionary with the parameters of add_motor() or a sequence of them
+         in the same order
+        :raises ValueError: Listing all invalid entries
+        """
+        entries = []
+        errors = []
+        names = set()
+        ports = {}
+        for number, motor in enumerate(motors, start=1):
+            label = f'Motor {number}'
+            kwargs, entry_errors = _table_entry(motor, MOTOR_COLUMNS, REQUIRED_MOTOR_COLUMNS, label)
+            if all(key in kwargs for key in ['motor_name', 'device', 'fmc_slot']) \
+                    and isinstance(kwargs.get('port_number'), int):
+                label = f'Motor {number} ("{kwargs["motor_name"]}")'
+                entry_errors += [f'{label}: {error}' for error in
+                                 self._motor_errors(kwargs['motor_name'], kwargs['device'], kwargs['fmc_slot'],
+                                                    kwargs['port_number'], names, ports)]
+                names.add(kwargs['motor_name'])
+                ports.setdefault((kwargs['device'], kwargs['fmc_slot'], kwargs['port_number']), kwargs['motor_name'])
+            errors += entry_errors
+            entries.append(kwargs)
+        if errors:
+            raise ValueError(f'{len(errors)} error(s) in motor table:\n' + '\n'.join(errors))
+        for kwargs in entries:
+            self._insert_motor(**kwargs)
+
+    @classmethod
+    def from_table(cls, motor_table: str, device_table: str = None, mapp_registry: MappRegistry = None) \
+            -> 'MotorConfig':
+        """Create a configuration database from a motor inventory.
+        :param motor_table: Path to a CSV file with one motor per row, or a TOML file with [[motor]] tables. The
+         columns are named like the parameters of add_motor(). A TOML file may hold the [[device]] tables as well.
+        :param device_table: Path to a CSV or TOML file with the devices, columns named like the parameters of
+         add_device(). Defaults to the [[device]] tables in motor_table, required if motor_table is a CSV file.
+        :param mapp_registry: Mapp-files to validate devices and motors against. No validation, if None.
+        :return: Configuration database holding all devices and motors
+        :raises ValueError: Listing all invalid entries
+        """
+        motor_cfg = cls(mapp_registry)
+        if device_table is not None:
+            motor_cfg.add_devices_bulk(_read_table(device_table, 'device'))
+        elif os.path.splitext(motor_table)[1].lower() == '.toml':
+            motor_cfg.add_devices_bulk(_read_table(motor_table, 'device'))
+        motor_cfg.add_motors_bulk(_read_table(motor_table, 'motor'))
+        return motor_cfg
+
+    def as_arrays(self) -> dict:
+        """Struct-of-arrays view of the motors, built in a single pass, to render per-motor lists in the templates.
+        :return: Dictionary of tuples, holding one attribute of all motors each, ordered by motor number
+        """
+        columns = ('name', 'type', 'device', 'board', 'fmc_slot', 'port', 'config_file', 'fmc_type',
+                   'motor_steps_ratio', 'encoder_steps_ratio', 'unit', 'dummy')
+        rows = [(motor.name, motor.type, motor.device.name, motor.device.board, motor.fmc_slot, motor.port,
+                 motor.config_file, motor.fmc_type, motor.steps_ratio[0], motor.steps_ratio[1], motor.unit,
+                 motor.is_dummy())
+                for motor in (self._motors[motor_number] for motor_number in range(self._number_motors))]
+        if not rows:
+            return {column: () for column in columns}
+        return dict(zip(columns, zip(*rows)))
+
+    def motor_by_name(self, motor_name: str) -> Motor:
+        """Look up a motor by its name.
+        :param motor_name: Name of the motor, as passed to add_motor()
+        :return: The motor
+        """
+        try:
+            return self._motor_names[motor_name]
+        except KeyError:
+            raise KeyError(f'Unknown motor: {motor_name}') from None
+
+    def motors_on_device(self, device_name: str) -> list:
+        """List the motors connected to a device, in the order they were added.
+        :param device_name: Name of the device, as passed to add_device()
+        :return: List of motors
+        """
+        if device_name not in self.devices:
+            raise ValueError(f'Unknown device: {device_name}\nKnown devices: {self.devices.keys()}')
+        return list(self._device_motors[device_name])
+
@@ -1,22 +1,207 @@
+##mako
 #!/usr/bin/python3
 
-import deviceaccess as da
+"""
+Initialise the FMC carriers of the motor drivers by releasing their reset (WORD_RESET_N).
+Usage:
+  initMotorDriverHW.py <dMapFileName> <boardAliasName> <bspName>
+    Initialise a single device.
+  initMotorDriverHW.py --all [<dMapFileName>] [-j <jobs>]
+    Initialise all devices of this server from a single process. The devices are opened and reset concurrently.
+    Defaults to devMapFile.dmap. Exits with 1, if any device fails.
+  --trace <report.json>
+    Record the latency of opening each device and of each register access and write them as JSON report, i.e. to
+    compare crates or firmware versions. Further registers to be read and timed can be given with --registers.
+To test without hardware, pass a dmap file, which maps the device aliases to the dummy backend, i.e.:
+  MotorDriver1 (dummy?map=mapp/<mapp file>)
+"""
+
+import argparse
+import json
 import sys
+import time
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+import deviceaccess as da
+
+# Devices of this server and the name of their board support module, rendered from motor_cfg.devices
+DEVICES = {
+% for device_name, device in motor_cfg.devices.items():
+    '${device_name}': '${device.board}',
+% endfor
+}
+
+
+def read_dmap(dmap_file_name):
+    """Reads the devices defined in a dmap file.
+    :param dmap_file_name: Path to the dmap file
+    :return: Device descriptor by device alias
+    """
+    descriptors = {}
+    with open(dmap_file_name) as dmap_file:
+        for line in dmap_file:
+            words = line.split('#', 1)[0].split()
+            if len(words) >= 2 and not words[0].startswith('@'):
+                descriptors[words[0]] = words[1]
+    return descriptors
+
+
+def plain_value(value):
+    """Converts register content to a JSON serializable value."""
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    return value
+
+
+class DeviceTrace:
+    """Records the latency of opening a device and of every register access."""
+
+    def __init__(self, device_name, reference_time):
+        """
+        :param device_name: Alias of the device in the dmap file
+        :param reference_time: time.perf_counter() value, the start times of the events refer to
+        """
+        self.device_name = device_name
+        self.reference_time = reference_time
+        self.events = []
+
+    def timed(self, operation, function, *args, register=None):
+        """Calls function and records its duration.
+        :param operation: Name of the operation, i.e. 'open', 'read' or 'write'
+        :param function: Function to be called with args
+        :param register: Register accessed by the operation
+        :return: Return value of function
+        """
+        start = time.perf_counter()
+        result = function(*args)
+        event = {'operation': operation,
+                 'register': register,
+                 'start_s': start - self.reference_time,
+                 'duration_s': time.perf_counter() - start}
+        if operation == 'read':
+            event['value'] = plain_value(result)
+        elif operation == 'write':
+            event['value'] = plain_value(args[-1])
+        self.events.append(event)
+        return result
+
+    def durations(self):
+        """Summary of the events for printing.
+        :return: Tuples of operation and duration in s
+        """
+        return [(event['operation'], event['duration_s']) for event in self.events]
+
+
+def init_device(device_name, bsp_name, trace, registers=()):
+    """Opens a device and releases its reset, if necessary.
+    :param device_name: Alias of the device in the dmap file
+    :param bsp_name: Name of the board support module, holding WORD_RESET_N
+    :param trace: DeviceTrace to record the latencies in
+    :param registers: Further registers to be read and timed
+    """
+    device = da.Device(device_name)
+    trace.timed('open', device.open)
+    try:
+        reset_register = f"{bsp_name}.WORD_RESET_N"
+        if trace.timed('read', device.read, reset_register, register=reset_register) == 0:
+            trace.timed('write', device.write, reset_register, 1, register=reset_register)
+        for register in registers:
+            trace.timed('read', device.read, register, register=register)
+    finally:  # Close the device, even if an access failed
+        trace.timed('close', device.close)
+
+
+def init_all_devices(dmap_file_name, jobs, report_file_name=None, registers=()):
+    """Initialises all devices of this server concurrently.
+    :param dmap_file_name: Path to the dmap file
+    :param jobs: Maximum number of threads
+    :param report_file_name: Path to write the JSON report to. No report is written, if None.
+    :param registers: Further registers to be read and timed on every device
+    :return: Number of devices, which failed
+    """
+    start_time = datetime.now()
+    reference_time = time.perf_counter()
+    da.setDMapFilePath(dmap_file_name)
+    descriptors = read_dmap(dmap_file_name)
+    failed = 0
+    report = []
+    for device_name, bsp_name in DEVICES.items():
+        if device_name not in descriptors:
+            print(f"Device {device_name} is not defined in {dmap_file_name}!", file=sys.stderr)
+            report.append({'device': device_name, 'bsp': bsp_name, 'descriptor': None, 'ok': False,
+                           'error': 'Not defined in dmap file', 'events': []})
+            failed += 1
+    devices = {name: bsp for name, bsp in DEVICES.items() if name in descriptors}
+    if devices:
+        print(f"Performing initialization of devices {', '.join(devices)}.")
+    else:
+        print(f"None of the devices is defined in {dmap_file_name}, no initialization performed.")
+    traces = {name: DeviceTrace(name, reference_time) for name in devices}
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(devices)))) as executor:
+        futures = {name: executor.submit(init_device, name, bsp, traces[name], registers)
+                   for name, bsp in devices.items()}
+        for device_name, future in futures.items():
+            error = None
+            try:
+                future.result()
+            except Exception as exception:  # Report failure of any device and carry on with the others
+                error = str(exception)
+                print(f"Initialization of device {device_name} failed: {error}", file=sys.stderr)
+                failed += 1
+            else:
+                steps = ', '.join(f"{operation} {duration * 1000:.1f} ms"
+                                  for operation, duration in traces[device_name].durations())
+                print(f"Device {device_name} initialized: {steps}")
+            report.append({'device': device_name, 'bsp': devices[device_name],
+                           'descriptor': descriptors[device_name], 'ok': error is None, 'error': error,
+                           'events': traces[device_name].events})
+    if report_file_name is not None:
+        with open(report_file_name, 'w') as report_file:
+            json.dump({'start': start_time.isoformat(),
+                       'dmap': dmap_file_name,
+                       'jobs': jobs,
+                       'total_s': time.perf_counter() - reference_time,
+                       'failed': failed,
+                       'devices': report}, report_file, indent=2)
+            report_file.write('\n')
+        print(f"Trace written to {report_file_name}.")
+    return failed
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(usage='%(prog)s <dMapFileName> <boardAliasName> <bspName>\n'
+                                           '       %(prog)s --all [<dMapFileName>] [-j <jobs>]\n'
+                                           '       [--trace <report.json>] [--registers <register> ...]',
+                                     description='Initialise the motor driver devices.')
+    parser.add_argument('args', nargs='*', help='dmap file, device alias and board support module name. '
+                                                'With --all only the dmap file, defaults to devMapFile.dmap.')
+    parser.add_argument('--all', action='store_true', help='Initialise all devices of this server concurrently.')
+    parser.add_argument('-j', type=int, default=len(DEVICES), help='Number of threads. Defaults to one per device.')
+    parser.add_argument('--trace', metavar='report.json', help='Write latencies of all device accesses to a file.')
+    parser.add_argument('--registers', nargs='+', default=[], metavar='register',
+                        help='Further registers to be read and timed on every device.')
+    args = parser.parse_args()
+
+    if args.all:
+        sys.exit(1 if init_all_devices(args.args[0] if args.args else 'devMapFile.dmap', args.j,
+                                       args.trace, args.registers) else 0)
 
-if len(sys.argv) < 4:
-    print("Usage: initMotorDriverHW.py <dMapFileName> <boardAliasName> <bspName>")
-    sys.exit(1)
+    if len(args.args) < 3:
+        parser.print_usage()
+        sys.exit(1)
 
-dMapFileName = sys.argv[1]
-deviceName = sys.argv[2]
-bspName = sys.argv[3]
+    dMapFileName, deviceName, bspName = args.args[:3]
 
-da.setDMapFilePath(dMapFileName)
+    if args.trace is not None or args.registers:  # Trace a single device
+        DEVICES = {deviceName: bspName}
+        sys.exit(1 if init_all_devices(dMapFileName, 1, args.trace, args.registers) else 0)
 
-print("Performing initialization of device "+deviceName+".")
-device = da.Device(deviceName)
-device.open()
+    da.setDMapFilePath(dMapFileName)
 
+    print("Performing initialization of device "+deviceName+".")
+    device = da.Device(deviceName)
+    device.open()
 
-if device.read(f"{bspName}.WORD_RESET_N") == 0:
-    device.write(f"{bspName}.WORD_RESET_N", 1)
+    if device.read(f"{bspName}.WORD_RESET_N") == 0:
+        device.write(f"{bspName}.WORD_RESET_N", 1)
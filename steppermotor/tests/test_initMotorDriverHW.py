@@ -0,0 +1,109 @@
+#!/usr/bin/python3
+
+"""@package docstring
+Tests for templates/initMotorDriverHW.py against the DeviceAccess dummy backend, defined in dummy.dmap. Run from this
+directory with "python3 -m unittest" or pytest. Requires mako and the DeviceAccess Python bindings.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+STEPPERMOTOR_DIR = os.path.dirname(TESTS_DIR)
+DMAP_FILE = os.path.join(TESTS_DIR, 'dummy.dmap')
+
+sys.path.insert(0, STEPPERMOTOR_DIR)
+from motorconfig import MotorConfig
+
+try:
+    from mako.template import Template
+except ImportError:
+    Template = None
+try:
+    import deviceaccess
+except ImportError:
+    deviceaccess = None
+
+
+@unittest.skipIf(Template is None or deviceaccess is None, 'Requires mako and the DeviceAccess Python bindings')
+class InitMotorDriverHWTest(unittest.TestCase):
+    """Renders initMotorDriverHW.py for the devices in dummy.dmap and runs it in a temporary directory."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        motor_cfg = MotorConfig()
+        motor_cfg.add_device('MotorDriver1', 'FMC25_70t_md22_md22', 4, 'uni_fmc_pzt4_ctrl', '2.0.0-0-g4e1f23e1')
+        motor_cfg.add_device('MotorDriver2', 'FMC25_70t', 5, 'controller_pzt4_md22_md22', 'r2261')
+        self.script = os.path.join(self.test_dir, 'initMotorDriverHW.py')
+        with open(self.script, 'w') as script_file:
+            script_file.write(Template(filename=os.path.join(STEPPERMOTOR_DIR, 'templates', 'initMotorDriverHW.py'))
+                              .render(motor_cfg=motor_cfg))
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def run_script(self, *args) -> subprocess.CompletedProcess:
+        """Runs the rendered script with the given command line arguments."""
+        return subprocess.run([sys.executable, self.script, *args], cwd=self.test_dir, stdin=subprocess.DEVNULL,
+                              stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+
+    def write_dmap(self, *device_names) -> str:
+        """Writes a dmap file with a subset of the devices in dummy.dmap.
+        :return: Path of the dmap file
+        """
+        dmap_file_name = os.path.join(self.test_dir, 'subset.dmap')
+        with open(DMAP_FILE) as dmap_file, open(dmap_file_name, 'w') as subset_file:
+            for line in dmap_file:
+                words = line.split()
+                if words and words[0] in device_names:
+                    # Resolve the map file relative to dummy.dmap, as the subset is written to the test directory
+                    subset_file.write(line.replace('map=../', f'map={STEPPERMOTOR_DIR}/'))
+        return dmap_file_name
+
+    def test_all(self):
+        result = self.run_script('--all', DMAP_FILE)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn('Performing initialization of devices MotorDriver1, MotorDriver2.', result.stdout)
+        self.assertIn('Device MotorDriver1 initialized', result.stdout)
+        self.assertIn('Device MotorDriver2 initialized', result.stdout)
+
+    def test_all_missing_device(self):
+        result = self.run_script('--all', self.write_dmap('MotorDriver1'))
+        self.assertEqual(result.returncode, 1)
+        self.assertIn('Device MotorDriver2 is not defined', result.stderr)
+        self.assertIn('Device MotorDriver1 initialized', result.stdout)
+
+    def test_all_no_device(self):
+        result = self.run_script('--all', self.write_dmap())
+        self.assertEqual(result.returncode, 1)
+        self.assertNotIn('Performing initialization of devices', result.stdout)
+        self.assertIn('None of the devices is defined', result.stdout)
+
+    def test_trace(self):
+        report_file_name = os.path.join(self.test_dir, 'report.json')
+        result = self.run_script('--all', DMAP_FILE, '--trace', report_file_name)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        with open(report_file_name) as report_file:
+            report = json.load(report_file)
+        self.assertEqual(report['failed'], 0)
+        self.assertEqual([device['device'] for device in report['devices']], ['MotorDriver1', 'MotorDriver2'])
+        for device in report['devices']:
+            self.assertTrue(device['ok'])
+            self.assertEqual([event['operation'] for event in device['events']], ['open', 'read', 'write', 'close'])
+            for event in device['events']:
+                self.assertLessEqual({'operation', 'register', 'start_s', 'duration_s'}, set(event))
+                self.assertGreaterEqual(event['start_s'], 0)
+                self.assertGreaterEqual(event['duration_s'], 0)
+            reset_register = f'{device["bsp"]}.WORD_RESET_N'
+            self.assertEqual([event['register'] for event in device['events'][1:3]], [reset_register] * 2)
+            # The reset of the dummy device is active after open, and is released by the script
+            self.assertEqual([event['value'] for event in device['events'][1:3]], [0, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
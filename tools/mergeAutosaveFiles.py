@@ -0,0 +1,82 @@
+#!/usr/bin/python3
+
+"""@package docstring
+Merges the autosave files of the former per-motor monitor sets, steppermotorserver-motor<N>.sav, into the file of the
+combined monitor set, steppermotorserver-motors.sav, so the values are kept, when an IOC is updated to the combined
+request file. Run it once per IOC, while the IOC is stopped, on its saves/ directory:
+  mergeAutosaveFiles.py /var/epics-servers/<station>/saves
+The per-motor files are kept. An existing combined file is only replaced with -f, as it holds newer values.
+"""
+
+import argparse  # Parse command line arguments
+import os  # For file manipulation
+import re
+import sys  # To access stdout and stderr
+
+PER_MOTOR_PATTERN = re.compile(r'^steppermotorserver-motor([0-9]+)\.sav$')
+COMBINED_FILE = 'steppermotorserver-motors.sav'
+END_MARKER = '<END>'
+
+
+def read_save_file(file_path: str) -> tuple:
+    """Reads an autosave file.
+    :param file_path: Path to the .sav file
+    :return: Tuple of header lines, starting with "#" or "!", and value lines, one "<PV> <value>" per line
+    :raises ValueError: If the file is incomplete, i.e. misses the end marker written by autosave
+    """
+    header = []
+    values = []
+    with open(file_path, encoding='utf-8') as save_file:
+        lines = save_file.read().splitlines()
+    if END_MARKER not in lines:
+        raise ValueError(f'{file_path} is incomplete, it misses "{END_MARKER}".')
+    for line in lines[:lines.index(END_MARKER)]:
+        if line.startswith(('#', '!')):
+            header.append(line)
+        elif line.strip():
+            values.append(line)
+    return header, values
+
+
+def merge_save_files(saves_dir: str, force: bool = False) -> int:
+    """Merges the per-motor autosave files of a directory into the combined file.
+    :param saves_dir: Directory of the autosave files
+    :param force: Replace an existing combined file
+    :return: Number of merged files
+    """
+    combined_path = os.path.join(saves_dir, COMBINED_FILE)
+    if os.path.exists(combined_path) and not force:
+        raise FileExistsError(f'{combined_path} exists. Use -f to replace it.')
+    per_motor_files = sorted((int(match.group(1)), match.group(0))
+                             for match in map(PER_MOTOR_PATTERN.match, os.listdir(saves_dir)) if match)
+    if not per_motor_files:
+        return 0
+    header = None
+    values = []
+    for _, file_name in per_motor_files:
+        file_header, file_values = read_save_file(os.path.join(saves_dir, file_name))
+        if header is None:  # Version line of autosave, it checks the format by it
+            header = [line for line in file_header if line.startswith('#')][:1]
+        values += file_values
+    with open(combined_path, 'w', encoding='utf-8') as combined_file:
+        combined_file.writelines(f'{line}\n' for line in header + values + [END_MARKER])
+    return len(per_motor_files)
+
+
+if __name__ == '__main__':
+    CLAP = argparse.ArgumentParser(description=f'Merges the per-motor autosave files into {COMBINED_FILE}.')
+    CLAP.add_argument('saves_dir',
+                      help='Directory of the autosave files of the IOC, i.e. saves/ in its working directory.')
+    CLAP.add_argument('-f',
+                      help=f'Replace an existing {COMBINED_FILE}.',
+                      action='store_true')
+    CLA = CLAP.parse_args()
+    try:
+        number_of_files = merge_save_files(CLA.saves_dir, CLA.f)
+    except (OSError, ValueError) as error:
+        sys.stderr.write(f'Error: {error}\n')
+        sys.exit(1)
+    if number_of_files == 0:
+        sys.stdout.write(f'No per-motor autosave files found in {CLA.saves_dir}.\n')
+    else:
+        sys.stdout.write(f'Merged {number_of_files} files into {os.path.join(CLA.saves_dir, COMBINED_FILE)}.\n')
@@ -0,0 +1,247 @@
+#!/usr/bin/python3
+
+"""@package docstring
+Renders the configuration of every host and station in the hostlist of a server type, in parallel.
+Each instance gets the namespace ConfigGenerator provides: HOSTNAME and INSTANCE_CONFIG, followed by baseconfig.py,
+all files in settings/ (sorted by name) and lastconfig.py. The files in templates/ are rendered by mako if they
+start with "##mako", and copied otherwise, into <output>/<server type>/<host>/<station>/.
+The configuration files and templates are compiled once in the main process, forked workers inherit them.
+"""
+
+import argparse  # Parse command line arguments
+import hashlib  # To key the template cache
+import marshal  # To store compiled templates
+import multiprocessing  # To select the start method of worker processes
+import os  # For file manipulation
+import shutil
+import sys  # To access stdout
+import time
+import types
+from concurrent.futures import ProcessPoolExecutor  # To render instances in parallel
+from typing import List, Dict, Any, Tuple, Optional  # Type hints
+
+import mako
+from mako.template import ModuleTemplate, Template
+
+# Compiled configuration files and templates, set by load_server_type() before the workers are forked
+_server_type = {}  # type: Dict[str, Any]
+
+
+class TemplateCache:
+    """On-disk cache of compiled mako templates. Entries are keyed by the template content, its path below templates/,
+    the mako version and the Python bytecode version, so a hit skips parsing and compiling the template.
+    """
+
+    def __init__(self, cache_dir: Optional[str]):
+        """
+        :param cache_dir: Directory to store compiled templates in. If None, templates are always compiled.
+        """
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def key(uri: str, source: bytes) -> str:
+        """Cache key of a template.
+        :param uri: Path of the template below templates/
+        :param source: Content of the template file
+        :return: Hex digest
+        """
+        template_hash = hashlib.sha256()
+        for part in (mako.__version__, sys.implementation.cache_tag, uri):
+            template_hash.update(part.encode('utf-8') + b'\0')
+        template_hash.update(source)
+        return template_hash.hexdigest()
+
+    def get(self, template_path: str, uri: str) -> Template:
+        """Provides compiled template, from the cache if possible.
+        :param template_path: Path to the template file
+        :param uri: Path of the template below templates/, identifies the template in error messages
+        :return: Template, ready to render
+        """
+        with open(template_path, 'rb') as file:
+            source = file.read()
+        if self.cache_dir is None:
+            self.misses += 1
+            return Template(text=source.decode('utf-8'), uri=uri)
+        cache_path = os.path.join(self.cache_dir, f'{self.key(uri, source)}.bin')
+        try:
+            with open(cache_path, 'rb') as cache_file:
+                module_source, module_code = marshal.load(cache_file)
+        except (OSError, EOFError, ValueError, TypeError):  # Not cached yet, or unreadable cache entry
+            pass
+        else:
+            module = types.ModuleType(uri)
+            exec(module_code, module.__dict__)
+            self.hits += 1
+            return ModuleTemplate(module, module_source=module_source, template_source=source.decode('utf-8'))
+        self.misses += 1
+        template = Template(text=source.decode('utf-8'), uri=uri)
+        temp_path = f'{cache_path}.{os.getpid()}.tmp'
+        try:
+            with open(temp_path, 'wb') as cache_file:
+                marshal.dump((template.code, compile(template.code, uri, 'exec')), cache_file)
+            os.replace(temp_path, cache_path)
+        except OSError as error:  # The cache is an optimization only
+            sys.stderr.write(f'Warning: Template cache entry for {uri} not written: {error}\n')
+        return template
+
+
+def read_hostlist(hostlist_path: str) -> List[Tuple[str, str, str]]:
+    """Reads the instances from a hostlist file.
+    :param hostlist_path: Path to the hostlist file
+    :return: List of instances as (host name, accelerator, station)
+    """
+    instances = []
+    with open(hostlist_path, encoding='utf-8') as hostlist:
+        for line in hostlist:
+            words = line.split()
+            if not words or words[0].startswith('#'):
+                continue
+            if len(words) < 4:
+                raise ValueError(f'Invalid line in {hostlist_path}: "{line.strip()}"')
+            host_name, _, prefix = words[:3]
+            for station in words[3:]:
+                instances.append((host_name, prefix.upper(), station))
+    return instances
+
+
+def load_server_type(server_type_dir: str, template_cache: Optional[TemplateCache] = None):
+    """Compiles the configuration files and templates of a server type into _server_type.
+    :param server_type_dir: Directory of the server type, holding hostlist, baseconfig.py, settings/ and templates/
+    :param template_cache: Cache of compiled templates. If None, all templates are compiled.
+    """
+    if template_cache is None:
+        template_cache = TemplateCache(None)
+    config_files = [os.path.join(server_type_dir, 'baseconfig.py')]
+    settings_dir = os.path.join(server_type_dir, 'settings')
+    config_files += [os.path.join(settings_dir, name) for name in sorted(os.listdir(settings_dir))
+                     if name.endswith('.py')]
+    config_files.append(os.path.join(server_type_dir, 'lastconfig.py'))
+    config_code = []
+    for config_file in config_files:
+        with open(config_file, encoding='utf-8') as file:
+            config_code.append(compile(file.read(), config_file, 'exec'))
+    templates_dir = os.path.join(server_type_dir, 'templates')
+    templates = {}  # type: Dict[str, Optional[Template]]
+    for dir_path, _, file_names in os.walk(templates_dir, followlinks=True):
+        for file_name in sorted(file_names):
+            template_path = os.path.join(dir_path, file_name)
+            relative_path = os.path.relpath(template_path, templates_dir)
+            with open(template_path, 'rb') as file:
+                is_mako = file.readline().startswith(b'##mako')
+            templates[relative_path] = template_cache.get(template_path, relative_path) if is_mako else None
+    _server_type.update(name=os.path.basename(os.path.normpath(server_type_dir)),
+                        templates_dir=templates_dir,
+                        config_code=config_code,
+                        templates=templates)
+
+
+def render_instance(host_name: str, accelerator: str, station: str, output_dir: str) -> Tuple[str, int]:
+    """Renders all templates for one instance.
+    :param host_name: Host name as given in the hostlist
+    :param accelerator: Common prefix of the hostlist entry
+    :param station: Station of the hostlist entry
+    :param output_dir: Directory to write the instance to
+    :return: Output directory of the instance and number of files written
+    """
+    namespace = {'HOSTNAME': host_name.split('.')[0], 'INSTANCE_CONFIG': (accelerator, station)}
+    for code in _server_type['config_code']:
+        exec(code, namespace)
+    make_executable = namespace.get('MAKE_EXECUTABLE', [])
+    if isinstance(make_executable, str):
+        make_executable = make_executable.split()
+    instance_dir = os.path.join(output_dir, _server_type['name'], host_name, station)
+    for relative_path, template in _server_type['templates'].items():
+        target_path = os.path.join(instance_dir, relative_path)
+        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+        if template is None:
+            shutil.copyfile(os.path.join(_server_type['templates_dir'], relative_path), target_path)
+        else:
+            with open(target_path, 'w', encoding='utf-8') as file:
+                file.write(template.render(**namespace))
+        if relative_path in make_executable:
+            os.chmod(target_path, 0o755)
+    return instance_dir, len(_server_type['templates'])
+
+
+def _render_instance_safely(host_name: str, accelerator: str, station: str, output_dir: str) -> Tuple[bool, str]:
+    """Calls render_instance() in a worker process and turns exceptions into a message.
+    :return: Success and a message, naming the output directory or the error
+    """
+    try:
+        instance_dir, number_files = render_instance(host_name, accelerator, station, output_dir)
+    except Exception as error:  # Report any error of the settings or templates, and carry on with other instances
+        return False, f'{host_name} {station}: {type(error).__name__}: {error}'
+    return True, f'{host_name} {station}: {number_files} files written to {instance_dir}'
+
+
+def main() -> int:
+    clap = argparse.ArgumentParser(
+        description='Renders the configuration of all hosts and stations in the hostlist of a server type.')
+    clap.add_argument('server_type_dir',
+                      help='Directory of the server type, i.e. "steppermotor" or "steppermotor-epics".')
+    clap.add_argument('-o',
+                      help='Output directory. Defaults to "rendered" in CWD.',
+                      metavar='output_dir',
+                      default='rendered')
+    clap.add_argument('-j',
+                      help='Number of processes. Defaults to the number of CPUs.',
+                      metavar='jobs',
+                      type=int,
+                      default=os.cpu_count() or 1)
+    clap.add_argument('-c',
+                      help='Directory of the compiled template cache. Defaults to ".mako-cache" in CWD.',
+                      metavar='cache_dir',
+                      default='.mako-cache')
+    clap.add_argument('--no-cache',
+                      help='Compile all templates, without reading or writing the template cache.',
+                      action='store_true')
+    clap.add_argument('--host',
+                      help='Only render instances of this host. Can be given multiple times.',
+                      action='append')
+    cla = clap.parse_args()
+
+    server_type_dir = os.path.abspath(cla.server_type_dir)
+    # baseconfig.py finds the shared modules below CFGDIR, which is set by configureThisHost.sh otherwise
+    os.environ.setdefault('CFGDIR', os.path.dirname(server_type_dir))
+    instances = read_hostlist(os.path.join(server_type_dir, 'hostlist'))
+    if cla.host is not None:
+        instances = [instance for instance in instances if instance[0] in cla.host]
+    if not instances:
+        sys.stderr.write('No instances to render.\n')
+        return 1
+    start = time.perf_counter()
+    template_cache = TemplateCache(None if cla.no_cache else os.path.abspath(cla.c))
+    load_server_type(server_type_dir, template_cache)
+    sys.stdout.write(f'Template cache: {template_cache.hits} hits, {template_cache.misses} misses.\n')
+    output_dir = os.path.abspath(cla.o)
+    # Forked workers inherit the compiled configuration files and templates
+    if 'fork' in multiprocessing.get_all_start_methods():
+        mp_context = multiprocessing.get_context('fork')
+    else:
+        mp_context = None
+    failed = 0
+    if mp_context is None:  # Without fork, every worker loads the server type itself
+        initializer, initargs = load_server_type, (server_type_dir, template_cache)
+    else:
+        initializer, initargs = None, ()
+    with ProcessPoolExecutor(max_workers=max(1, min(cla.j, len(instances))), mp_context=mp_context,
+                             initializer=initializer, initargs=initargs) as executor:
+        futures = [executor.submit(_render_instance_safely, *instance, output_dir) for instance in instances]
+        for future in futures:
+            success, message = future.result()
+            if not success:
+                failed += 1
+                sys.stderr.write(f'Error: {message}\n')
+            else:
+                sys.stdout.write(f'{message}\n')
+    sys.stdout.write(f'Rendered {len(instances) - failed} of {len(instances)} instances in '
+                     f'{time.perf_counter() - start:.2f} s.\n')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())